@@ -1,10 +1,26 @@
+import numpy as np
 from fastapi import APIRouter
 from app.api.schemas import BacktestRequest
+from app.core.responses import ORJSONResponse
 from app.services.backtest_engine import run_backtest
 
 router = APIRouter(prefix="/api/v1", tags=["backtest"])
 
 
+def _narrow_rolling_metrics(result: dict) -> dict:
+    """
+    Swap rolling-metric values for float32 scalars, which ORJSONResponse
+    writes with float32's short repr (the UI shows ~4 digits).
+    """
+    for points in result["rolling_metrics"]["series"].values():
+        # None (a gap in the series) becomes NaN and is left as None
+        values = np.array([p["value"] for p in points], dtype=np.float32)
+        for point, value in zip(points, values):
+            if point["value"] is not None:
+                point["value"] = value
+    return result
+
+
 @router.post("/backtest")
 def backtest(request: BacktestRequest):
     """
@@ -13,4 +29,5 @@ def backtest(request: BacktestRequest):
     Backend execution starts here.
     """
     result = run_backtest(request)
-    return result
+    # float32 scalars need orjson: render directly rather than via jsonable_encoder
+    return ORJSONResponse(_narrow_rolling_metrics(result))
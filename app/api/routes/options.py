@@ -9,7 +9,7 @@ Each endpoint:
 4. Returns JSON results
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from datetime import date
 
 from app.api.schemas import (
@@ -23,14 +23,18 @@ from app.api.schemas import (
     PayoffRequest,
     StrategyTimelineRequest,
 )
+from app.core.body import json_body, json_body_openapi
+from app.core.concurrency import run_blocking, run_in_process
+from app.core.config import MC_THREADS
+from app.core.responses import ORJSONResponse
 from app.services.options.options_service import OptionsService
 
 router = APIRouter(prefix="/api/v1/options", tags=["options"])
 service = OptionsService()
 
 
-@router.post("/monte-carlo")
-def run_monte_carlo(request: MonteCarloRequest):
+@router.post("/monte-carlo", openapi_extra=json_body_openapi(MonteCarloRequest))
+async def run_monte_carlo(request: MonteCarloRequest = Depends(json_body(MonteCarloRequest))):
     """
     Run Monte Carlo scenario analysis.
     
@@ -40,21 +44,27 @@ def run_monte_carlo(request: MonteCarloRequest):
     - Percentiles (1st, 5th, 25th, 50th, 75th, 95th, 99th)
     - VaR and CVaR
     - Tail statistics
+    - Terminal value samples (optional)
     """
-    return service.run_monte_carlo(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    result = await run_in_process(
+        service.run_monte_carlo,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         horizon_days=request.horizon_days,
         n_sims=request.n_sims,
         vol=request.vol,
         drift=request.drift,
         seed=request.seed,
+        return_samples=request.return_samples,
+        n_threads=MC_THREADS,
     )
+    # Samples stay an ndarray: render directly, skipping jsonable_encoder's walk
+    return ORJSONResponse(result)
 
 
 @router.post("/crash")
-def run_crash(request: CrashScenarioRequest):
+async def run_crash(request: CrashScenarioRequest):
     """
     Run deterministic market crash scenarios.
     
@@ -66,97 +76,109 @@ def run_crash(request: CrashScenarioRequest):
     Returns:
     - Portfolio value and Greeks for each crash level
     """
-    return service.run_crash_scenario(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    return await run_blocking(
+        service.run_crash_scenario,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         crashes=request.crashes,
     )
 
 
-@router.post("/spot-vol-surface")
-def run_spot_vol_surface(request: SpotVolSurfaceRequest):
+@router.post("/spot-vol-surface", openapi_extra=json_body_openapi(SpotVolSurfaceRequest))
+async def run_spot_vol_surface(request: SpotVolSurfaceRequest = Depends(json_body(SpotVolSurfaceRequest))):
     """
     Evaluate portfolio on a Spot × Volatility surface.
     
     Returns a grid of portfolio values and Greeks.
     Frontend-ready for heatmap visualization.
     """
-    return service.run_spot_vol_surface(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    surface = await run_blocking(
+        service.run_spot_vol_surface,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         spots=request.spots,
         vols=request.vols,
+        precision=request.precision,
     )
+    # Dense float grids: render directly, skipping jsonable_encoder's walk
+    return ORJSONResponse(surface)
 
 
-@router.post("/spot-time-surface")
-def run_spot_time_surface(request: SpotTimeSurfaceRequest):
+@router.post("/spot-time-surface", openapi_extra=json_body_openapi(SpotTimeSurfaceRequest))
+async def run_spot_time_surface(request: SpotTimeSurfaceRequest = Depends(json_body(SpotTimeSurfaceRequest))):
     """
     Evaluate portfolio on a Spot × Time surface.
     
     Returns a grid of portfolio values and Greeks.
     Frontend-ready for heatmap visualization.
     """
-    return service.run_spot_time_surface(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    surface = await run_blocking(
+        service.run_spot_time_surface,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         spots=request.spots,
         horizons=request.horizons,
+        precision=request.precision,
     )
+    # Dense float grids: render directly, skipping jsonable_encoder's walk
+    return ORJSONResponse(surface)
 
 
 @router.post("/spot-scenario")
-def run_spot_scenario(request: SpotScenarioRequest):
+async def run_spot_scenario(request: SpotScenarioRequest):
     """
     Run deterministic spot price scenarios.
     
     Evaluates portfolio at different spot prices.
     Useful for P&L analysis.
     """
-    return service.run_spot_scenario(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    return await run_blocking(
+        service.run_spot_scenario,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         spots=request.spots,
     )
 
 
 @router.post("/vol-scenario")
-def run_vol_scenario(request: VolScenarioRequest):
+async def run_vol_scenario(request: VolScenarioRequest):
     """
     Run deterministic volatility scenarios.
     
     Evaluates portfolio at different volatility levels.
     Useful for vega analysis.
     """
-    return service.run_vol_scenario(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    return await run_blocking(
+        service.run_vol_scenario,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         vols=request.vols,
     )
 
 
 @router.post("/time-scenario")
-def run_time_scenario(request: TimeScenarioRequest):
+async def run_time_scenario(request: TimeScenarioRequest):
     """
     Run deterministic time decay scenarios.
     
     Evaluates portfolio at different time horizons.
     Useful for theta analysis.
     """
-    return service.run_time_scenario(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    return await run_blocking(
+        service.run_time_scenario,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         horizons=request.horizons,
     )
 
 @router.post("/payoff")
-def run_payoff(request: PayoffRequest):
+async def run_payoff(request: PayoffRequest):
     """
     Generate payoff curves and value surfaces.
     
@@ -168,10 +190,11 @@ def run_payoff(request: PayoffRequest):
     - Value curve at today (optional)
     - Greeks along spot grid (optional)
     """
-    return service.run_payoff(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
-        today=date.fromisoformat(request.today),
+    return await run_blocking(
+        service.run_payoff,
+        positions=request.positions,
+        market=request.market,
+        today=request.today_date,
         expiry_date=date.fromisoformat(request.expiry_date),
         spot_center=request.spot_center,
         pct_range=request.pct_range,
@@ -182,7 +205,7 @@ def run_payoff(request: PayoffRequest):
 
 
 @router.post("/strategy-timeline")
-def run_strategy_timeline(request: StrategyTimelineRequest):
+async def run_strategy_timeline(request: StrategyTimelineRequest):
     """
     Compute strategy timeline over historical period.
     
@@ -195,10 +218,13 @@ def run_strategy_timeline(request: StrategyTimelineRequest):
     - Individual option values over time
     - Entry/expiry markers
     """
-    return service.run_strategy_timeline(
-        positions=[p.dict() for p in request.positions],
-        market=request.market.dict(),
+    timeline = await run_blocking(
+        service.run_strategy_timeline,
+        positions=request.positions,
+        market=request.market,
         symbol=request.symbol,
-        start_date=request.start_date,
-        end_date=request.end_date,
-    )
\ No newline at end of file
+        start_date=date.fromisoformat(request.start_date),
+        end_date=date.fromisoformat(request.end_date),
+    )
+    # Large plain-float columns: render directly, skipping jsonable_encoder's walk
+    return ORJSONResponse(timeline)
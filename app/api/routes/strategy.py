@@ -2,8 +2,13 @@
 Strategy Timeline API Routes
 """
 
+from datetime import date
+
 from fastapi import APIRouter, HTTPException
 from app.api.schemas import StrategyTimelineRequest
+from app.core.concurrency import run_blocking
+from app.core.responses import ORJSONResponse
+from app.services.options.options_service import OptionsService
 from app.services.options.timeline import compute_strategy_timeline
 
 router = APIRouter(prefix="/api/v1/strategy", tags=["strategy"])
@@ -25,23 +30,20 @@ async def get_strategy_timeline(request: StrategyTimelineRequest):
         }
     """
     try:
-        result = compute_strategy_timeline(
-            positions=[p.dict() for p in request.positions],
-            market={
-                "spot": request.market.spot,
-                "rate": request.market.rate,
-                "volatility": request.market.volatility,
-                "dividend_yield": request.market.dividend_yield or 0.0,
-            },
+        result = await run_blocking(
+            compute_strategy_timeline,
+            positions=request.positions,
+            market=OptionsService.parse_market(request.market),
             symbol=request.symbol,
-            start_date=request.start_date,
-            end_date=request.end_date,
+            start_date=date.fromisoformat(request.start_date),
+            end_date=date.fromisoformat(request.end_date),
         )
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
 
-        return result
+        # Large plain-float columns: render directly, skipping jsonable_encoder's walk
+        return ORJSONResponse(result)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
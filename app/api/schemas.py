@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Literal
 from datetime import date
 
+from app.core.config import WEIGHT_SUM_TOLERANCE
+
 
 class PositionInput(BaseModel):
     ticker: str = Field(..., min_length=1)
@@ -40,7 +42,7 @@ class BacktestRequest(BaseModel):
     @classmethod
     def validate_weights(cls, positions):
         total_weight = sum(p.weight for p in positions)
-        if total_weight > 1.0:
+        if total_weight > 1.0 + WEIGHT_SUM_TOLERANCE:
             raise ValueError(
                 f"Sum of weights must be <= 1.0, got {total_weight}"
             )
@@ -63,6 +65,15 @@ class OptionPositionInput(BaseModel):
     entry_price: Optional[float] = Field(default=None, ge=0, description="Premium paid/received at entry (optional)")
     entry_date: Optional[str] = Field(default=None, description="Entry date (ISO format: YYYY-MM-DD, optional)")
 
+    @field_validator("expiry", "entry_date")
+    @classmethod
+    def validate_iso_date(cls, value):
+        # The services parse these with date.fromisoformat and the timeline
+        # orders and matches them as strings: only YYYY-MM-DD is accepted
+        if value and date.fromisoformat(value).isoformat() != value:
+            raise ValueError(f"Expected an ISO date (YYYY-MM-DD), got {value!r}")
+        return value
+
 
 class MarketSnapshotInput(BaseModel):
     """Market snapshot for options pricing."""
@@ -72,73 +83,64 @@ class MarketSnapshotInput(BaseModel):
     volatility: float = Field(..., gt=0, le=3.0, description="Volatility (sigma)")
 
 
-class MonteCarloRequest(BaseModel):
-    """Monte Carlo scenario analysis request."""
+class OptionsRequest(BaseModel):
+    """Fields shared by every options analysis request."""
     positions: List[OptionPositionInput]
     market: MarketSnapshotInput
     today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
+
+    @property
+    def today_date(self) -> date:
+        """Valuation date parsed from `today`."""
+        return date.fromisoformat(self.today)
+
+
+class MonteCarloRequest(OptionsRequest):
+    """Monte Carlo scenario analysis request."""
     horizon_days: int = Field(..., gt=0, description="Simulation horizon (days)")
     n_sims: int = Field(default=10_000, gt=0, description="Number of simulations")
     vol: Optional[float] = Field(default=None, gt=0, description="Override volatility")
     drift: Optional[float] = Field(default=None, description="Override drift")
     seed: Optional[int] = Field(default=None, ge=0, description="Random seed")
+    return_samples: bool = Field(default=False, description="Include simulated terminal portfolio values")
 
 
-class CrashScenarioRequest(BaseModel):
+class CrashScenarioRequest(OptionsRequest):
     """Crash scenario analysis request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     crashes: List[float] = Field(..., description="Crash percentages (negative, e.g., [-0.15, -0.25])")
 
 
-class SpotVolSurfaceRequest(BaseModel):
+class SpotVolSurfaceRequest(OptionsRequest):
     """Spot × Volatility surface request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     spots: List[float] = Field(..., min_length=1, description="Spot prices to evaluate")
     vols: List[float] = Field(..., min_length=1, description="Volatilities to evaluate")
+    precision: Literal["fp32", "fp64"] = Field(default="fp32", description="Working precision (fp32 is enough for heatmaps)")
 
 
-class SpotTimeSurfaceRequest(BaseModel):
+class SpotTimeSurfaceRequest(OptionsRequest):
     """Spot × Time surface request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     spots: List[float] = Field(..., min_length=1, description="Spot prices to evaluate")
     horizons: List[int] = Field(..., min_length=1, description="Time horizons (days) to evaluate")
+    precision: Literal["fp32", "fp64"] = Field(default="fp32", description="Working precision (fp32 is enough for heatmaps)")
 
 
-class SpotScenarioRequest(BaseModel):
+class SpotScenarioRequest(OptionsRequest):
     """Spot scenario analysis request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     spots: List[float] = Field(..., min_length=1, description="Spot prices to evaluate")
 
 
-class VolScenarioRequest(BaseModel):
+class VolScenarioRequest(OptionsRequest):
     """Volatility scenario analysis request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     vols: List[float] = Field(..., min_length=1, description="Volatilities to evaluate")
 
 
-class TimeScenarioRequest(BaseModel):
+class TimeScenarioRequest(OptionsRequest):
     """Time decay scenario analysis request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     horizons: List[int] = Field(..., min_length=1, description="Time horizons (days) to evaluate")
 
 
-class PayoffRequest(BaseModel):
+class PayoffRequest(OptionsRequest):
     """Payoff curve analysis request."""
-    positions: List[OptionPositionInput]
-    market: MarketSnapshotInput
-    today: str = Field(..., description="Valuation date (ISO format: YYYY-MM-DD)")
     expiry_date: str = Field(..., description="Option expiration date (ISO format: YYYY-MM-DD)")
     spot_center: float = Field(..., gt=0, description="Center spot for grid generation")
     pct_range: float = Field(default=0.5, gt=0, description="Range as percentage (e.g., 0.5 = ±50%)")
@@ -0,0 +1,53 @@
+"""
+Request-body parsing for numeric-heavy endpoints.
+
+FastAPI decodes JSON bodies with the stdlib `json` module and then
+validates the resulting Python objects. For grid/simulation requests
+(long float lists) it is cheaper to hand the raw bytes straight to
+Pydantic's Rust JSON parser with `model_validate_json`.
+"""
+
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def json_body(model: Type[M]) -> Callable[[Request], Any]:
+    """
+    Dependency that validates the raw request body as `model`.
+
+    Validation failures surface as the usual 422 `RequestValidationError`.
+    """
+
+    async def dependency(request: Request) -> M:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)],
+                body=body,
+            )
+
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    `openapi_extra` documenting a `json_body` dependency as the request body.
+
+    Nested models are referenced as components; they are registered by the
+    routes that still take these models as regular bodies.
+    """
+    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
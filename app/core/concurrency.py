@@ -0,0 +1,43 @@
+"""
+Helpers for running blocking work off the event loop.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+async def run_blocking(func, /, *args, **kwargs):
+    """
+    Run a blocking (CPU-bound) call on the event loop's default executor.
+
+    The default executor is replaced at startup by a dedicated, sized pool
+    (see app.main), so heavy pricing requests queue there instead of
+    starving the event loop or the shared AnyIO worker threads.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+def set_process_pool(pool: Optional[ProcessPoolExecutor]) -> None:
+    """Install (or clear, with None) the pool used by `run_in_process`."""
+    global _process_pool
+    _process_pool = pool
+
+
+async def run_in_process(func, /, *args, **kwargs):
+    """
+    Run a long CPU-bound call in the worker process pool.
+
+    Gives concurrent simulations real parallelism without tying up the
+    thread pool that serves cheaper endpoints. `func` and its arguments
+    must be picklable. Falls back to `run_blocking` when no pool is
+    installed (e.g. the app was started without its lifespan).
+    """
+    if _process_pool is None:
+        return await run_blocking(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_process_pool, partial(func, *args, **kwargs))
@@ -0,0 +1,27 @@
+"""
+Runtime configuration, read once from the environment at import.
+"""
+
+import os
+
+# Slack for portfolio weights that sum to 1.0 only up to float/JSON round-off
+WEIGHT_SUM_TOLERANCE = 1e-9
+
+# Server worker processes sharing the machine. A plain `uvicorn app.main:app`
+# is one process; the production launcher (python -m app.main) exports its
+# worker count here before starting them.
+SERVER_WORKERS = max(1, int(os.getenv("QI_WORKERS", 1)))
+
+# Each server worker's even share of the cores. Pool sizes default to it to
+# avoid oversubscription when several workers run side by side.
+_WORKER_CORES = max(1, (os.cpu_count() or 4) // SERVER_WORKERS)
+
+# Worker threads used for CPU-bound service calls (pricing, scenarios, backtests).
+THREADPOOL_WORKERS = int(os.getenv("QI_POOL", _WORKER_CORES))
+
+# Worker processes for long-running simulations (Monte Carlo); 0 disables the pool.
+PROCESS_POOL_WORKERS = int(os.getenv("QI_PROCS", _WORKER_CORES))
+
+# Threads one Monte Carlo call may use to revalue large path sets (NumPy releases
+# the GIL). Defaults to the cores left over once every pool process has one.
+MC_THREADS = int(os.getenv("QI_MC_THREADS", max(1, _WORKER_CORES // max(1, PROCESS_POOL_WORKERS))))
@@ -0,0 +1,36 @@
+"""
+Application logging.
+
+Request handlers only enqueue records; a background listener thread does
+the formatting and I/O, so a burst of errors can't stall the event loop
+on stderr writes.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+APP_LOGGER = "app"
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def start_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route the `app` logger hierarchy through a queue to stderr.
+
+    Returns the running listener; call `.stop()` on shutdown to flush.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+
+    sink = logging.StreamHandler()
+    sink.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger(APP_LOGGER)
+    logger.setLevel(level)
+    logger.handlers[:] = [QueueHandler(records)]
+    logger.propagate = False
+
+    listener = QueueListener(records, sink, respect_handler_level=True)
+    listener.start()
+    return listener
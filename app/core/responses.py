@@ -0,0 +1,24 @@
+"""
+Response classes shared by the API routers.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Much faster than stdlib json on large nested float grids, and NumPy
+    arrays/scalars serialize natively, so handlers that return this
+    response directly can skip `.tolist()` and `jsonable_encoder`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -3,28 +3,76 @@ Quant Insights Backend
 Main FastAPI application
 """
 
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from app.core.concurrency import set_process_pool
+from app.core.logging import start_logging
+from app.core.config import PROCESS_POOL_WORKERS, THREADPOOL_WORKERS
+from app.core.responses import ORJSONResponse
 from app.api.routes.backtest import router as backtest_router
 from app.api.routes.options import router as options_router
 from app.api.routes.market import router as market_router
 from app.api.routes.strategy import router as strategy_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start queued logging and install dedicated, sized pools for CPU-bound route work."""
+    log_listener = start_logging()
+
+    executor = ThreadPoolExecutor(
+        max_workers=THREADPOOL_WORKERS,
+        thread_name_prefix="qi-worker",
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    # Spawned (not forked) workers: the parent already runs threads
+    processes = None
+    if PROCESS_POOL_WORKERS > 0:
+        processes = ProcessPoolExecutor(
+            max_workers=PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        set_process_pool(processes)
+
+    yield
+
+    set_process_pool(None)
+    if processes is not None:
+        processes.shutdown(wait=False, cancel_futures=True)
+    executor.shutdown(wait=False, cancel_futures=True)
+    log_listener.stop()
+
+
 app = FastAPI(
     title="Quant Insights",
     description="Backtesting and portfolio analysis API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Enable CORS for frontend
+# Enable CORS for frontend. Methods/headers are listed explicitly (the
+# frontend only sends JSON GET/POST) and preflights are cached for a day.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
+# Compress larger payloads (surfaces, backtest series); small ones aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=2048)
+
 # Include routers
 app.include_router(backtest_router)
 app.include_router(options_router)
@@ -45,4 +93,21 @@ def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # Production launcher. "auto" picks uvloop/httptools when installed
+    # (uvicorn[standard]) and falls back to asyncio/h11 elsewhere (Windows).
+    # Access logs are off: a log line per request is a measurable cost at load.
+    # The worker count is exported so each worker sizes its pools from its
+    # share of the cores (see app.core.config).
+    workers = int(os.getenv("QI_WORKERS", os.cpu_count() or 1))
+    os.environ["QI_WORKERS"] = str(workers)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=workers,
+        log_level="info",
+        access_log=False,
+    )
@@ -1,17 +1,41 @@
-import pandas as pd
 import numpy as np
 
 from app.api.schemas import BacktestRequest
-from app.services.market_data.loader import load_prices
+from app.services.market_data.cache import load_prices_cached
 from app.services.portfolio.simulator import simulate_portfolio
-from app.services.metrics.metrics import compute_metrics, compute_rolling_metrics
-from app.services.serialization.series import serialize_series
+from app.services.metrics.metrics import (
+    compute_metrics,
+    compute_rolling_metrics,
+    periods_per_year,
+)
+from app.services.serialization.series import format_dates, serialize_series
+
+
+# Keys of the scalar metrics dict, split by response section
+PORTFOLIO_METRIC_KEYS = ("total_return", "cagr", "volatility", "sharpe", "max_drawdown")
+RELATIVE_METRIC_KEYS = ("excess_return", "tracking_error", "information_ratio")
+
+
+def _portfolio_is_benchmark(request: BacktestRequest) -> bool:
+    """
+    True when the portfolio simulation is exactly the benchmark one:
+    100% in the benchmark ticker, fractional shares, no cash accrual.
+    """
+    if len(request.positions) != 1:
+        return False
+    position = request.positions[0]
+    return (
+        position.ticker == request.benchmark_ticker
+        and position.weight == 1.0
+        and request.fractional_shares
+        and request.risk_free_rate == 0.0
+    )
 
 
 def run_backtest(request: BacktestRequest | dict) -> dict:
     # --- Normalize input ---
     if isinstance(request, dict):
-        request = BacktestRequest(**request)
+        request = BacktestRequest.model_validate(request)
 
     # --- 1. Collect tickers ---
     equity_tickers = [p.ticker for p in request.positions]
@@ -21,7 +45,7 @@ def run_backtest(request: BacktestRequest | dict) -> dict:
         tickers.append(request.benchmark_ticker)
 
     # --- 2. Load prices ---
-    prices = load_prices(
+    prices = load_prices_cached(
         tickers=tickers,
         start_date=request.start_date,
         end_date=request.end_date,
@@ -41,7 +65,9 @@ def run_backtest(request: BacktestRequest | dict) -> dict:
 
     # --- 4. Benchmark simulation ---
     benchmark_result = None
-    if request.benchmark_ticker:
+    if request.benchmark_ticker and _portfolio_is_benchmark(request):
+        benchmark_result = portfolio_result
+    elif request.benchmark_ticker:
         benchmark_result = simulate_portfolio(
             prices=prices[[request.benchmark_ticker]],
             weights={request.benchmark_ticker: 1.0},
@@ -52,12 +78,14 @@ def run_backtest(request: BacktestRequest | dict) -> dict:
         )
 
     # --- 5. Scalar metrics ---
+    ppy = periods_per_year(portfolio_result.daily_returns)
     metrics = compute_metrics(
         nav=portfolio_result.nav,
         returns=portfolio_result.daily_returns,
         risk_free_rate=request.risk_free_rate,
         benchmark_nav=benchmark_result.nav if benchmark_result else None,
         benchmark_returns=benchmark_result.daily_returns if benchmark_result else None,
+        ppy=ppy,
     )
 
     # --- 6. Rolling metrics ---
@@ -65,27 +93,22 @@ def run_backtest(request: BacktestRequest | dict) -> dict:
         nav=portfolio_result.nav,
         returns=portfolio_result.daily_returns,
         risk_free_rate=request.risk_free_rate,
+        ppy=ppy,
     )
 
-    # --- 7. Split scalar metrics ---
-    relative_metric_keys = {
-        "excess_return",
-        "tracking_error",
-        "information_ratio",
-    }
+    # NAV, equity, cash and the rolling metrics all share the simulation
+    # index: format its dates once for every serialized series.
+    nav_index = portfolio_result.nav.index
+    date_strs = format_dates(nav_index)
 
-    portfolio_metrics = {
-        k: float(v)
-        for k, v in metrics.items()
-        if k not in relative_metric_keys
-    }
+    def dates_for(series):
+        return date_strs if series.index.equals(nav_index) else None
+
+    # --- 7. Split scalar metrics ---
+    portfolio_metrics = {k: float(metrics[k]) for k in PORTFOLIO_METRIC_KEYS}
 
     relative_metrics = (
-        {
-            k: float(v)
-            for k, v in metrics.items()
-            if k in relative_metric_keys
-        }
+        {k: float(metrics[k]) for k in RELATIVE_METRIC_KEYS}
         if benchmark_result
         else None
     )
@@ -93,16 +116,14 @@ def run_backtest(request: BacktestRequest | dict) -> dict:
     # --- 8. Serialize rolling metrics with proper structure ---
     # Convert { dates: [...], values: [...] } to [{ date, value }, ...]
     def serialize_rolling_series(series):
-        dates = series.index.strftime("%Y-%m-%d").tolist()
-        values = [
-            None if (pd.isna(v) or np.isinf(v)) else v
-            for v in series.values
-        ]
+        dates = dates_for(series) or format_dates(series.index)
+        values = series.to_numpy(dtype=float)
+        finite = np.isfinite(values)
         return [
-            {"date": d, "value": v}
-            for d, v in zip(dates, values)
+            {"date": d, "value": v if f else None}
+            for d, v, f in zip(dates, values.tolist(), finite.tolist())
         ]
-    
+
     rolling_metrics = {
         "window_days": 252,
         "series": {
@@ -115,11 +136,14 @@ def run_backtest(request: BacktestRequest | dict) -> dict:
     return {
         "success": True,
         "series": {
-            "nav": serialize_series(portfolio_result.nav),
-            "equity": serialize_series(portfolio_result.equity_value),
-            "cash": serialize_series(portfolio_result.cash),
+            "nav": serialize_series(portfolio_result.nav, date_strs),
+            "equity": serialize_series(
+                portfolio_result.equity_value,
+                dates_for(portfolio_result.equity_value),
+            ),
+            "cash": serialize_series(portfolio_result.cash, dates_for(portfolio_result.cash)),
             "benchmark_nav": (
-                serialize_series(benchmark_result.nav)
+                serialize_series(benchmark_result.nav, dates_for(benchmark_result.nav))
                 if benchmark_result
                 else None
             ),
@@ -0,0 +1,79 @@
+"""
+In-process cache in front of the market data loader.
+
+Interactive clients request the same ticker/date windows over and over
+(chart toggles, re-running a backtest with different weights). Only
+providers whose output is fixed for a given (tickers, start, end) are
+memoized, and results are handed out as copies. Live providers (yahoo,
+stooq) go straight to the loader, so a window ending today is never
+frozen for the life of the process.
+
+Under pandas Copy-on-Write (always on from pandas 3) those copies are
+shallow: O(1) per hit, with any write by a caller copying lazily.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+import pandas as pd
+
+from app.services.market_data.loader import load_prices
+
+
+CACHE_SIZE = 256
+
+# Providers whose prices never change for a given window
+CACHED_PROVIDERS = frozenset({"mock"})
+
+# pandas 2.x also accepts "warn", which is truthy but does not protect
+# shallow copies; only an explicit True counts
+_COPY_ON_WRITE = (
+    int(pd.__version__.split(".")[0]) >= 3
+    or pd.get_option("mode.copy_on_write") is True
+)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_load(
+    tickers: Tuple[str, ...],
+    start_date: str,
+    end_date: str,
+    provider: str,
+) -> pd.DataFrame:
+    return load_prices(
+        tickers=list(tickers),
+        start_date=start_date,
+        end_date=end_date,
+        provider=provider,
+    )
+
+
+def load_prices_cached(
+    tickers: Iterable[str],
+    start_date: str,
+    end_date: str,
+    provider: str = "mock",
+) -> pd.DataFrame:
+    """
+    Same contract as `load_prices`, served from an LRU cache for
+    CACHED_PROVIDERS; other providers are loaded fresh on every call.
+
+    The key keeps ticker order because the loader returns columns in
+    input order. A copy is returned so callers can't mutate the cached
+    frame.
+    """
+    if provider not in CACHED_PROVIDERS:
+        return load_prices(
+            tickers=list(tickers),
+            start_date=start_date,
+            end_date=end_date,
+            provider=provider,
+        )
+
+    prices = _cached_load(tuple(tickers), start_date, end_date, provider)
+    return prices.copy(deep=not _COPY_ON_WRITE)
+
+
+def clear_price_cache() -> None:
+    """Drop every cached price frame."""
+    _cached_load.cache_clear()
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import List
 
@@ -59,16 +60,18 @@ def _standardize_prices(df: pd.DataFrame, tickers: List[str]) -> pd.DataFrame:
     if not isinstance(df.index, pd.DatetimeIndex):
         raise TypeError("Market data index must be a DatetimeIndex")
 
-    # Sort by date
-    df = df.sort_index()
+    # Sort by date (providers usually return sorted data already)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
 
     # Ensure required columns exist
     missing = set(tickers) - set(df.columns)
     if missing:
         raise ValueError(f"Missing tickers in data: {missing}")
 
-    # Enforce column order
-    df = df[tickers]
+    # Enforce column order, skipping the copy when it already matches
+    if not df.columns.equals(pd.Index(tickers)):
+        df = df[tickers]
 
     df.index.name = "date"
 
@@ -83,10 +86,13 @@ def _validate_prices(df: pd.DataFrame):
     if df.empty:
         raise ValueError("No market data returned")
 
-    if df.isnull().any().any():
+    # One float buffer for both checks instead of per-column Series masks
+    values = df.to_numpy(dtype=float, copy=False)
+
+    if np.isnan(values).any():
         raise ValueError("Market data contains NaNs")
 
-    if (df <= 0).any().any():
+    if (values <= 0).any():
         raise ValueError("Market data contains non-positive prices")
 
     if not df.index.is_monotonic_increasing:
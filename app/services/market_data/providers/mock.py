@@ -29,30 +29,26 @@ class MockMarketDataProvider(MarketDataProvider):
 
         rng = np.random.default_rng(seed=42)  # 🔒 deterministic
 
-        data = {}
-
         for ticker in tickers:
             if ticker not in TICKER_CONFIG:
                 raise ValueError(f"Mock provider does not support ticker: {ticker}")
 
-            cfg = TICKER_CONFIG[ticker]
-
-            start_price = cfg["start"]
-            annual_vol = cfg["vol"]
-            daily_vol = annual_vol / np.sqrt(252)
-            daily_drift = 0.05 / 252  # modest positive drift
-
-            # random walk (log returns)
-            shocks = rng.normal(
-                loc=daily_drift,
-                scale=daily_vol,
-                size=n,
-            )
-
-            prices = start_price * np.exp(np.cumsum(shocks))
-            data[ticker] = prices
-
-        df = pd.DataFrame(data, index=dates)
+        start_prices = np.array([TICKER_CONFIG[t]["start"] for t in tickers])
+        daily_vols = np.array([TICKER_CONFIG[t]["vol"] for t in tickers]) / np.sqrt(252)
+        daily_drift = 0.05 / 252  # modest positive drift
+
+        # random walk (log returns), one (tickers, dates) block. Row i holds
+        # the same draws a per-ticker loop over the shared stream would.
+        shocks = daily_drift + daily_vols[:, None] * rng.standard_normal(size=(len(tickers), n))
+        prices = start_prices[:, None] * np.exp(np.cumsum(shocks, axis=1))
+
+        # A repeated ticker keeps its first column slot and last draw
+        rows = {ticker: i for i, ticker in enumerate(tickers)}
+        df = pd.DataFrame(
+            np.ascontiguousarray(prices[list(rows.values())].T),
+            index=dates,
+            columns=list(rows),
+        )
         df.index.name = "date"
 
         return df
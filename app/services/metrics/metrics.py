@@ -6,9 +6,20 @@ TRADING_DAYS = 252
 
 
 # ---------- Core helpers ----------
+def _span_days(index: pd.Index) -> int:
+    """
+    Whole calendar days between the first and last timestamp.
+
+    Same value as `(index[-1] - index[0]).days`, computed on the
+    datetime64 values (whatever their unit) without building Timestamps.
+    """
+    values = index.values
+    return int((values[-1] - values[0]) // np.timedelta64(1, "D"))
+
+
 def periods_per_year(nav: pd.Series) -> float:
     index = nav.index
-    days = (index[-1] - index[0]).days
+    days = _span_days(index)
     if days <= 0:
         return 252.0
     return len(index) / (days / 365.25)
@@ -16,22 +27,30 @@ def periods_per_year(nav: pd.Series) -> float:
 
 
 def total_return(nav: pd.Series) -> float:
-    return nav.iloc[-1] / nav.iloc[0] - 1.0
+    values = nav.to_numpy()
+    return values[-1] / values[0] - 1.0
 
 
 def cagr(nav: pd.Series) -> float:
-    n_years = (nav.index[-1] - nav.index[0]).days / 365.25
-    return (nav.iloc[-1] / nav.iloc[0]) ** (1 / n_years) - 1.0
+    n_years = _span_days(nav.index) / 365.25
+    values = nav.to_numpy()
+    return (values[-1] / values[0]) ** (1 / n_years) - 1.0
 
 
 
-def annualized_volatility(returns: pd.Series) -> float:
-    ppy = periods_per_year(returns)
+def annualized_volatility(returns: pd.Series, ppy: float | None = None) -> float:
+    if ppy is None:
+        ppy = periods_per_year(returns)
     return returns.std() * np.sqrt(ppy)
 
 
-def sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.0) -> float:
-    ppy = periods_per_year(returns)
+def sharpe_ratio(
+    returns: pd.Series,
+    risk_free_rate: float = 0.0,
+    ppy: float | None = None,
+) -> float:
+    if ppy is None:
+        ppy = periods_per_year(returns)
     excess_returns = returns - risk_free_rate / ppy
     if excess_returns.std() == 0:
         return np.nan
@@ -54,34 +73,57 @@ def excess_return(
     return total_return(portfolio_nav) - total_return(benchmark_nav)
 
 
-def tracking_error(portfolio_returns, benchmark_returns):
-    ppy = periods_per_year(portfolio_returns)
-    diff = portfolio_returns - benchmark_returns
-    return diff.std() * np.sqrt(ppy)
+def _active_returns(portfolio_returns: pd.Series, benchmark_returns: pd.Series) -> np.ndarray:
+    """
+    Portfolio minus benchmark returns as a plain array.
+
+    Series on the same index (the backtest case) are subtracted as raw
+    arrays; otherwise pandas aligns them first, as before.
+    """
+    if portfolio_returns.index.equals(benchmark_returns.index):
+        return portfolio_returns.to_numpy(dtype=float) - benchmark_returns.to_numpy(dtype=float)
+    return (portfolio_returns - benchmark_returns).to_numpy(dtype=float)
+
+
+def _tracking_error(diff: np.ndarray, ppy: float) -> float:
+    # ddof=1 and NaN-skipping, like Series.std()
+    return np.nanstd(diff, ddof=1) * np.sqrt(ppy)
+
+
+def _information_ratio(diff: np.ndarray, ppy: float) -> float:
+    std = np.nanstd(diff, ddof=1)
+    if std * np.sqrt(ppy) == 0:
+        return np.nan
+    return np.nanmean(diff) / std * np.sqrt(ppy)
+
+
+def tracking_error(portfolio_returns, benchmark_returns, ppy: float | None = None):
+    if ppy is None:
+        ppy = periods_per_year(portfolio_returns)
+    return _tracking_error(_active_returns(portfolio_returns, benchmark_returns), ppy)
 
 
 def information_ratio(
     portfolio_returns: pd.Series,
     benchmark_returns: pd.Series,
+    ppy: float | None = None,
 ) -> float:
-    te = tracking_error(portfolio_returns, benchmark_returns)
-    if te == 0:
-        return np.nan
-
-    diff = portfolio_returns - benchmark_returns
-    ppy = periods_per_year(portfolio_returns)
-    return diff.mean() / diff.std() * np.sqrt(ppy)
+    if ppy is None:
+        ppy = periods_per_year(portfolio_returns)
+    return _information_ratio(_active_returns(portfolio_returns, benchmark_returns), ppy)
 
 #rolling metrics
 
 def rolling_volatility(
     returns: pd.Series,
     window: int = TRADING_DAYS,
+    ppy: float | None = None,
 ) -> pd.Series:
     """
     Rolling annualized volatility.
     """
-    ppy = periods_per_year(returns)
+    if ppy is None:
+        ppy = periods_per_year(returns)
 
     return (
         returns
@@ -94,21 +136,23 @@ def rolling_sharpe(
     returns: pd.Series,
     risk_free_rate: float = 0.0,
     window: int = TRADING_DAYS,
+    ppy: float | None = None,
 ) -> pd.Series:
     """
     Rolling Sharpe ratio using the same RF handling
     as the static Sharpe.
     """
-    ppy = periods_per_year(returns)
+    if ppy is None:
+        ppy = periods_per_year(returns)
     excess_returns = returns - risk_free_rate / ppy
 
-    rolling_mean = excess_returns.rolling(window=window).mean()
-    rolling_std = excess_returns.rolling(window=window).std()
-
-    sharpe = rolling_mean / rolling_std * np.sqrt(ppy)
-    sharpe[rolling_std == 0] = np.nan
+    # pandas' rolling mean/std already run as single-pass running-sum
+    # kernels; one Rolling object serves both.
+    rolling = excess_returns.rolling(window=window)
+    rolling_mean = rolling.mean()
+    rolling_std = rolling.std()
 
-    return sharpe
+    return (rolling_mean / rolling_std * np.sqrt(ppy)).mask(rolling_std == 0)
 
 def rolling_max_drawdown(
     nav: pd.Series,
@@ -116,17 +160,26 @@ def rolling_max_drawdown(
 ) -> pd.Series:
     """
     Rolling maximum drawdown over a fixed window.
+
+    Each value is the worst peak-to-trough drop measured from the start of
+    its window. All windows advance together: step k folds the k-th value
+    of every window into its running peak and worst drawdown, so the work
+    is `window` contiguous passes over the series with O(N) memory.
     """
+    values = nav.to_numpy(dtype=float)
+    out = np.full(len(values), np.nan)
+    n_windows = len(values) - window + 1
 
-    def _window_max_drawdown(x: pd.Series) -> float:
-        running_max = x.cummax()
-        drawdown = x / running_max - 1.0
-        return drawdown.min()
+    if window > 0 and n_windows > 0:
+        peak = values[:n_windows].copy()
+        worst = values[:n_windows] / peak - 1.0
+        for k in range(1, window):
+            current = values[k:k + n_windows]
+            np.maximum(peak, current, out=peak)
+            np.minimum(worst, current / peak - 1.0, out=worst)
+        out[window - 1:] = worst
 
-    return nav.rolling(window=window).apply(
-        _window_max_drawdown,
-        raw=False,
-    )
+    return pd.Series(out, index=nav.index, name=nav.name)
 
 def rolling_cagr(
     nav: pd.Series,
@@ -134,36 +187,21 @@ def rolling_cagr(
 ) -> pd.Series:
     """
     Rolling CAGR over a fixed window.
+
+    Only the first and last NAV of each window matter, so this is a shift
+    and an element-wise power rather than a per-window callback.
     """
 
     years = window / TRADING_DAYS
 
-    def _window_cagr(x: pd.Series) -> float:
-        start = x.iloc[0]
-        end = x.iloc[-1]
-        if start <= 0:
-            return np.nan
-        return (end / start) ** (1 / years) - 1.0
-
-    return nav.rolling(window=window).apply(
-        _window_cagr,
-        raw=False,
-    )
-
-def compute_rolling_metrics(
-    nav: pd.Series,
-    returns: pd.Series,
-    risk_free_rate: float = 0.0,
-    window: int = TRADING_DAYS,
-) -> dict:
-    return {
-        "rolling_volatility": rolling_volatility(returns, window),
-        "rolling_sharpe": rolling_sharpe(returns, risk_free_rate, window),
-        "rolling_max_drawdown": rolling_max_drawdown(nav, window),
-        "rolling_cagr": rolling_cagr(nav, window),
-    }
+    start = nav.shift(window - 1)
+    # Same NaN rules as a full-window rolling aggregation
+    valid = (nav.rolling(window=window).count() == window) & (start > 0)
 
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr_values = (nav / start) ** (1 / years) - 1.0
 
+    return cagr_values.where(valid)
 
 # ---------- Main entry point ----------
 
@@ -173,30 +211,35 @@ def compute_metrics(
     risk_free_rate: float = 0.0,
     benchmark_nav: pd.Series | None = None,
     benchmark_returns: pd.Series | None = None,
+    ppy: float | None = None,
 ) -> dict:
     """
     Compute portfolio (and optional benchmark) metrics.
     Returns only scalar metrics.
+
+    `ppy` may be passed in when the caller already derived it from
+    `returns` (e.g. to share it with `compute_rolling_metrics`).
     """
+    # Every annualized metric reads the same returns index
+    if ppy is None:
+        ppy = periods_per_year(returns)
 
     metrics = {
         "total_return": total_return(nav),
         "cagr": cagr(nav),
-        "volatility": annualized_volatility(returns),
-        "sharpe": sharpe_ratio(returns, risk_free_rate),
+        "volatility": annualized_volatility(returns, ppy),
+        "sharpe": sharpe_ratio(returns, risk_free_rate, ppy),
         "max_drawdown": max_drawdown(nav),
     }
 
     if benchmark_nav is not None and benchmark_returns is not None:
+        # Both relative metrics read the same active-return array
+        diff = _active_returns(returns, benchmark_returns)
         metrics.update(
             {
                 "excess_return": excess_return(nav, benchmark_nav),
-                "tracking_error": tracking_error(
-                    returns, benchmark_returns
-                ),
-                "information_ratio": information_ratio(
-                    returns, benchmark_returns
-                ),
+                "tracking_error": _tracking_error(diff, ppy),
+                "information_ratio": _information_ratio(diff, ppy),
             }
         )
 
@@ -208,14 +251,17 @@ def compute_rolling_metrics(
     returns: pd.Series,
     risk_free_rate: float = 0.0,
     window: int = TRADING_DAYS,
+    ppy: float | None = None,
 ) -> dict[str, pd.Series]:
     """
     Compute rolling metrics.
     Returns dict with Series values.
     """
+    if ppy is None:
+        ppy = periods_per_year(returns)
     return {
-        "rolling_volatility": rolling_volatility(returns, window=window),
-        "rolling_sharpe": rolling_sharpe(returns, risk_free_rate=risk_free_rate, window=window),
+        "rolling_volatility": rolling_volatility(returns, window=window, ppy=ppy),
+        "rolling_sharpe": rolling_sharpe(returns, risk_free_rate=risk_free_rate, window=window, ppy=ppy),
         "rolling_max_drawdown": rolling_max_drawdown(nav, window=window),
         "rolling_cagr": rolling_cagr(nav, window=window),
     }
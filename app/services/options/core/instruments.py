@@ -5,7 +5,7 @@ from typing import Literal
 OptionType = Literal["call", "put"]
 StyleType = Literal["european", "american"]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionContract:
     symbol: str
     option_type: OptionType
@@ -5,17 +5,23 @@ This module bridges the API layer and the options engine.
 It hides engine complexity and provides a clean interface for backend operations.
 """
 
-from datetime import date
-from typing import Iterable, List, Dict, Optional
+from datetime import date, datetime
+from typing import Any, Iterable, List, Dict, Optional, Sequence
 
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
-from app.services.options.portfolio.portfolio import Position
+from app.services.options.portfolio.portfolio import (
+    Position,
+    PositionArrays,
+    net_positions,
+    pack_positions,
+)
 from app.services.options.scenarios.monte_carlo import monte_carlo_scenario
 from app.services.options.scenarios.stress import crash_scenario
 from app.services.options.scenarios.surfaces import spot_vol_surface, spot_time_surface
 from app.services.options.scenarios.scenarios import spot_scenario, vol_scenario, time_scenario
 from app.services.options.scenarios.payoff import payoff_scenario, PayoffConfig, make_spot_grid
+from app.services.options.utils.payload import field
 
 
 class OptionsService:
@@ -27,17 +33,23 @@ class OptionsService:
     - Provides stable API for backend routes
     - Handles conversion between JSON payloads and domain objects
     - Is easy to mock in tests
+
+    Every `run_*` method also accepts positions and market already parsed
+    with `parse_positions` / `parse_market`, so a caller running several
+    scenarios on the same portfolio parses the payload once.
     """
 
     @staticmethod
-    def parse_positions(positions_payload: List[Dict]) -> List[Position]:
+    def parse_positions(positions_payload: Sequence[Any]) -> List[Position]:
         """
         Convert JSON positions to domain objects.
         
         Parameters
         ----------
-        positions_payload : list of dict
-            JSON positions from frontend/API
+        positions_payload : list of dict, OptionPositionInput or Position
+            JSON positions from frontend/API; validated request models
+            are read directly, without a dict round-trip, and already
+            parsed positions are kept as-is
             
         Returns
         -------
@@ -46,59 +58,88 @@ class OptionsService:
         """
         positions = []
         for p in positions_payload:
+            if isinstance(p, Position):
+                positions.append(p)
+                continue
             opt = OptionContract(
-                symbol=p["symbol"],
-                option_type=p["type"],  # "call" or "put"
-                style=p.get("style", "european"),  # default to european
-                strike=p["strike"],
-                expiry=date.fromisoformat(p["expiry"]),
+                symbol=field(p, "symbol"),
+                option_type=field(p, "type"),  # "call" or "put"
+                style=field(p, "style", "european"),  # default to european
+                strike=field(p, "strike"),
+                expiry=date.fromisoformat(field(p, "expiry")),
             )
-            positions.append(Position(opt, p.get("quantity", 1.0)))
+            positions.append(Position(opt, field(p, "quantity", 1.0)))
         return positions
 
+    @classmethod
+    def parse_positions_soa(cls, positions_payload: Sequence[Any]) -> PositionArrays:
+        """
+        Convert JSON positions to netted struct-of-arrays form.
+
+        Parameters
+        ----------
+        positions_payload : list of dict, OptionPositionInput or Position
+            JSON positions from frontend/API, or an already packed
+            PositionArrays (returned unchanged)
+
+        Returns
+        -------
+        PositionArrays
+            Strike / expiry / quantity / call-flag arrays, one entry per
+            distinct contract, for the vectorized grid engines
+        """
+        if isinstance(positions_payload, PositionArrays):
+            return positions_payload
+        return pack_positions(net_positions(cls.parse_positions(positions_payload)))
+
     @staticmethod
-    def parse_market(market_payload: Dict) -> MarketSnapshot:
+    def parse_market(market_payload: Any) -> MarketSnapshot:
         """
         Convert JSON market data to domain object.
         
         Parameters
         ----------
-        market_payload : dict
-            JSON market data from frontend/API
+        market_payload : dict, MarketSnapshotInput or MarketSnapshot
+            JSON market data from frontend/API; a parsed snapshot is
+            returned unchanged
             
         Returns
         -------
         MarketSnapshot
             Domain model market snapshot
         """
-        from datetime import datetime
+        if isinstance(market_payload, MarketSnapshot):
+            return market_payload
+        timestamp = field(market_payload, "timestamp")
         return MarketSnapshot(
-            spot=market_payload["spot"],
-            rate=market_payload["rate"],
-            dividend_yield=market_payload.get("dividend_yield", 0.0),
-            volatility=market_payload["volatility"],
-            timestamp=market_payload.get("timestamp", datetime.now().isoformat()),
+            spot=field(market_payload, "spot"),
+            rate=field(market_payload, "rate"),
+            dividend_yield=field(market_payload, "dividend_yield", 0.0),
+            volatility=field(market_payload, "volatility"),
+            timestamp=timestamp if timestamp is not None else datetime.now().isoformat(),
         )
 
     def run_monte_carlo(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         horizon_days: int,
         n_sims: int = 10_000,
         vol: Optional[float] = None,
         drift: Optional[float] = None,
         seed: Optional[int] = None,
+        return_samples: bool = False,
+        n_threads: int = 1,
     ) -> Dict:
         """
         Run Monte Carlo scenario analysis.
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -112,13 +153,17 @@ class OptionsService:
             Override drift calculation
         seed : int, optional
             Random seed for reproducibility
+        return_samples : bool
+            Include the terminal portfolio values (ndarray) under "samples"
+        n_threads : int
+            Threads for revaluing large path sets
             
         Returns
         -------
         dict
             Monte Carlo results (percentiles, tail metrics, etc.)
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return monte_carlo_scenario(
@@ -130,12 +175,14 @@ class OptionsService:
             vol=vol,
             drift=drift,
             seed=seed,
+            return_samples=return_samples,
+            n_threads=n_threads,
         )
 
     def run_crash_scenario(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         crashes: List[float],
     ) -> List[Dict]:
@@ -144,9 +191,9 @@ class OptionsService:
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -158,7 +205,7 @@ class OptionsService:
         list of dict
             Results for each crash level
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return crash_scenario(
@@ -170,20 +217,21 @@ class OptionsService:
 
     def run_spot_vol_surface(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         spots: List[float],
         vols: List[float],
+        precision: str = "fp64",
     ) -> Dict:
         """
         Evaluate portfolio on a spot × volatility surface.
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -191,13 +239,15 @@ class OptionsService:
             Spot prices to evaluate
         vols : list of float
             Volatilities to evaluate
+        precision : {"fp64", "fp32"}
+            Working precision; "fp32" returns float32 arrays for display
             
         Returns
         -------
         dict
             Surface data (frontend-ready)
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return spot_vol_surface(
@@ -206,24 +256,26 @@ class OptionsService:
             today=today,
             spots=spots,
             vols=vols,
+            precision=precision,
         )
 
     def run_spot_time_surface(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         spots: List[float],
         horizons: List[int],
+        precision: str = "fp64",
     ) -> Dict:
         """
         Evaluate portfolio on a spot × time surface.
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -231,13 +283,15 @@ class OptionsService:
             Spot prices to evaluate
         horizons : list of int
             Time horizons (days) to evaluate
+        precision : {"fp64", "fp32"}
+            Working precision; "fp32" returns float32 arrays for display
             
         Returns
         -------
         dict
             Surface data (frontend-ready)
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return spot_time_surface(
@@ -246,12 +300,13 @@ class OptionsService:
             today=today,
             spots=spots,
             days_forward=horizons,
+            precision=precision,
         )
 
     def run_spot_scenario(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         spots: List[float],
     ) -> List[Dict]:
@@ -260,9 +315,9 @@ class OptionsService:
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -274,7 +329,7 @@ class OptionsService:
         list of dict
             Results for each spot level
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return spot_scenario(
@@ -286,8 +341,8 @@ class OptionsService:
 
     def run_vol_scenario(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         vols: List[float],
     ) -> List[Dict]:
@@ -296,9 +351,9 @@ class OptionsService:
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -310,7 +365,7 @@ class OptionsService:
         list of dict
             Results for each volatility level
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return vol_scenario(
@@ -322,8 +377,8 @@ class OptionsService:
 
     def run_time_scenario(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         horizons: List[int],
     ) -> List[Dict]:
@@ -332,9 +387,9 @@ class OptionsService:
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -346,7 +401,7 @@ class OptionsService:
         list of dict
             Results for each time horizon
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         return time_scenario(
@@ -358,8 +413,8 @@ class OptionsService:
 
     def run_payoff(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         today: date,
         expiry_date: date,
         spot_center: float,
@@ -373,9 +428,9 @@ class OptionsService:
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             JSON option positions
-        market : dict
+        market : dict or MarketSnapshotInput
             JSON market snapshot
         today : date
             Valuation date
@@ -397,7 +452,7 @@ class OptionsService:
         dict
             Payoff curves with metadata
         """
-        domain_positions = self.parse_positions(positions)
+        domain_positions = self.parse_positions_soa(positions)
         domain_market = self.parse_market(market)
         
         # Generate spot grid
@@ -424,11 +479,11 @@ class OptionsService:
 
     def run_strategy_timeline(
         self,
-        positions: List[Dict],
-        market: Dict,
+        positions: Sequence[Any],
+        market: Any,
         symbol: str,
-        start_date: str,
-        end_date: str,
+        start_date: date,
+        end_date: date,
     ) -> Dict:
         """
         Compute strategy timeline over historical period.
@@ -438,16 +493,16 @@ class OptionsService:
         
         Parameters
         ----------
-        positions : list of dict
+        positions : list of dict or OptionPositionInput
             Option and stock positions
-        market : dict
+        market : dict or MarketSnapshotInput
             Market snapshot
         symbol : str
             Underlying symbol
-        start_date : str
-            Start date (YYYY-MM-DD)
-        end_date : str
-            End date (YYYY-MM-DD)
+        start_date : date
+            Start date
+        end_date : date
+            End date
             
         Returns
         -------
@@ -458,7 +513,7 @@ class OptionsService:
         
         return compute_strategy_timeline(
             positions=positions,
-            market=market,
+            market=self.parse_market(market),
             symbol=symbol,
             start_date=start_date,
             end_date=end_date,
@@ -1,8 +1,11 @@
 from .portfolio import (
     Position,
+    PositionArrays,
+    pack_positions,
     position_price,
     position_greeks,
     portfolio_price,
     portfolio_greeks,
+    portfolio_grid,
     delta_hedge_shares,
 )
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, Dict
+from typing import Iterable, Dict, List
+
+import numpy as np
 
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.pricing.black_scholes import price as bs_price
 from app.services.options.pricing.greeks import greeks as bs_greeks
+from app.services.options.pricing.vectorized import bs_price_greeks
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     A portfolio position in a single option contract.
@@ -23,6 +27,20 @@ class Position:
     quantity: float = 1.0
 
 
+def net_positions(positions: Iterable[Position]) -> List[Position]:
+    """
+    Merge positions that hold the same contract into one, summing quantities.
+
+    Portfolio value and Greeks are linear in quantity, so the netted book
+    prices identically while each distinct contract is evaluated once.
+    First-seen order is preserved.
+    """
+    netted: Dict[OptionContract, float] = {}
+    for p in positions:
+        netted[p.contract] = netted.get(p.contract, 0.0) + p.quantity
+    return [Position(contract, quantity) for contract, quantity in netted.items()]
+
+
 def position_price(pos: Position, market: MarketSnapshot, today: date) -> float:
     return pos.quantity * bs_price(pos.contract, market, today)
 
@@ -52,6 +70,124 @@ def portfolio_greeks(positions: Iterable[Position], market: MarketSnapshot, toda
     return totals
 
 
+# Below this time to expiry (years) reduced precision is not trusted: in
+# float32 a near-the-money leg a day from expiry is off by cents
+SHORT_EXPIRY_YEARS = 7 / 365
+
+# Target scenario points x positions per kernel call in `portfolio_grid`
+GRID_TILE_ELEMENTS = 1 << 16
+
+
+@dataclass(frozen=True)
+class PositionArrays:
+    """
+    Struct-of-arrays view of a list of positions, one entry per position.
+
+    Expiries are stored as proleptic ordinals so the same packing serves
+    any valuation date: days to expiry = expiry_ordinal - today.toordinal().
+    """
+    strike: np.ndarray
+    expiry_ordinal: np.ndarray
+    quantity: np.ndarray
+    is_call: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+
+def pack_positions(positions: Iterable[Position]) -> PositionArrays:
+    """Pack positions into typed arrays for the vectorized kernels."""
+    if isinstance(positions, PositionArrays):
+        return positions
+    positions = list(positions)
+    n = len(positions)
+    return PositionArrays(
+        strike=np.fromiter((p.contract.strike for p in positions), np.float64, n),
+        expiry_ordinal=np.fromiter((p.contract.expiry.toordinal() for p in positions), np.int64, n),
+        quantity=np.fromiter((p.quantity for p in positions), np.float64, n),
+        is_call=np.fromiter((p.contract.option_type == "call" for p in positions), np.bool_, n),
+    )
+
+
+def portfolio_grid(
+    positions: Iterable[Position] | PositionArrays,
+    market: MarketSnapshot,
+    today: date,
+    *,
+    spot=None,
+    volatility=None,
+    days_forward=0,
+    dtype=np.float64,
+    greeks=True,
+) -> Dict[str, np.ndarray]:
+    """
+    Portfolio value and Greeks over a grid of scenarios in one array pass.
+
+    `spot`, `volatility` and `days_forward` are broadcast against each other
+    (defaulting to the market snapshot / today); the result arrays have the
+    broadcast shape, summed over positions with quantity weights. Matches
+    `portfolio_price` / `portfolio_greeks` evaluated point by point.
+
+    Accepts positions already packed with `pack_positions` to skip repacking.
+    `dtype=np.float32` trades precision for bandwidth on display-only grids;
+    it falls back to float64 when any live leg expires within
+    SHORT_EXPIRY_YEARS, where d1 is too ill-conditioned for float32. `greeks=False` returns only "value".
+    """
+    book = pack_positions(positions)
+    days_to_expiry = (book.expiry_ordinal - today.toordinal()).astype(np.float64)
+    T = (days_to_expiry - np.asarray(days_forward, dtype=np.float64)[..., None]) / 365.0
+
+    if dtype != np.float64 and np.any((T > 0) & (T < SHORT_EXPIRY_YEARS)):
+        dtype = np.float64
+
+    S = np.asarray(market.spot if spot is None else spot, dtype=dtype)[..., None]
+    sigma = np.asarray(market.volatility if volatility is None else volatility, dtype=dtype)[..., None]
+    quantity = book.quantity.astype(dtype, copy=False)
+
+    # Contracts already past expiry in every scenario are pure intrinsic
+    # value: evaluate them apart so the BS pipeline only runs on live ones
+    expired = np.all(T <= 0, axis=tuple(range(T.ndim - 1)))
+    if not expired.any() or expired.all():
+        return _aggregate(S, book.strike, T, book.is_call, quantity, sigma, market, dtype, greeks)
+
+    live = ~expired
+    totals = _aggregate(
+        S, book.strike[live], T[..., live], book.is_call[live], quantity[live],
+        sigma, market, dtype, greeks,
+    )
+    past = _aggregate(
+        S, book.strike[expired], T[..., expired], book.is_call[expired], quantity[expired],
+        sigma, market, dtype, greeks,
+    )
+    return {k: totals[k] + past[k] for k in totals}
+
+
+def _aggregate(S, K, T, is_call, quantity, sigma, market, dtype, greeks) -> Dict[str, np.ndarray]:
+    """
+    Quantity-weighted sums over the trailing position axis.
+
+    Positions are evaluated in blocks of about GRID_TILE_ELEMENTS scenario
+    points each and accumulated, so the kernel's temporaries span one
+    block rather than the full (scenarios x positions) array.
+    """
+    n_points = math.prod(np.broadcast_shapes(S.shape[:-1], T.shape[:-1], sigma.shape[:-1]))
+    step = max(1, GRID_TILE_ELEMENTS // max(1, n_points))
+
+    totals = None
+    for lo in range(0, max(len(K), 1), step):
+        block = slice(lo, lo + step)
+        g = bs_price_greeks(
+            S, K[block], T[..., block], market.rate, market.dividend_yield, sigma, is_call[block],
+            dtype=dtype, greeks=greeks,
+        )
+        q = quantity[block]
+        part = {"value": g["price"] @ q}
+        if greeks:
+            part.update({k: g[k] @ q for k in ("delta", "gamma", "vega", "theta", "rho")})
+        totals = part if totals is None else {k: totals[k] + part[k] for k in totals}
+    return totals
+
+
 def delta_hedge_shares(positions: Iterable[Position], market: MarketSnapshot, today: date) -> float:
     """
     Shares of underlying needed to delta-hedge the portfolio.
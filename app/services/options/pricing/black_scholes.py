@@ -1,30 +1,32 @@
 import math
 from datetime import date
-from scipy.stats import norm
 
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
+from app.services.options.pricing.common import (
+    scalar_norm_cdf as norm_cdf,
+    scalar_norm_pdf as norm_pdf,
+)
 
 
-def price(
-    option: OptionContract,
-    market: MarketSnapshot,
-    today: date
+def bs_price_scalar(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    q: float,
+    sigma: float,
+    is_call: bool,
 ) -> float:
     """
-    European Black-Scholes price
-    """
-    S = market.spot
-    K = option.strike
-    r = market.rate
-    q = market.dividend_yield
-    sigma = market.volatility
-
-    T = (option.expiry - today).days / 365.0
+    European Black-Scholes price from plain floats (T in years).
 
+    The kernel behind `price`, for callers that already hold the inputs
+    and want to skip the contract/snapshot unpacking and date arithmetic.
+    """
     # Intrinsic value at expiry
     if T <= 0:
-        if option.option_type == "call":
+        if is_call:
             return max(S - K, 0.0)
         else:
             return max(K - S, 0.0)
@@ -32,27 +34,83 @@ def price(
     # Guard against zero volatility
     if sigma <= 0:
         forward = S * math.exp(-q * T) - K * math.exp(-r * T)
-        if option.option_type == "call":
+        if is_call:
             return max(forward, 0.0)
         else:
             return max(-forward, 0.0)
 
     sqrt_T = math.sqrt(T)
+    disc_q = math.exp(-q * T)
+    disc_r = math.exp(-r * T)
 
     d1 = (
         math.log(S / K)
-        + (r - q + 0.5 * sigma ** 2) * T
+        + (r - q + 0.5 * sigma * sigma) * T
     ) / (sigma * sqrt_T)
 
     d2 = d1 - sigma * sqrt_T
 
-    if option.option_type == "call":
+    if is_call:
         return (
-            S * math.exp(-q * T) * norm.cdf(d1)
-            - K * math.exp(-r * T) * norm.cdf(d2)
+            S * disc_q * norm_cdf(d1)
+            - K * disc_r * norm_cdf(d2)
         )
     else:
         return (
-            K * math.exp(-r * T) * norm.cdf(-d2)
-            - S * math.exp(-q * T) * norm.cdf(-d1)
+            K * disc_r * norm_cdf(-d2)
+            - S * disc_q * norm_cdf(-d1)
         )
+
+
+def bs_price_vega_scalar(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    q: float,
+    sigma: float,
+    is_call: bool,
+) -> tuple[float, float]:
+    """
+    Black-Scholes price and vega (per 1.00 vol) from plain floats.
+
+    One evaluation of sqrt(T), the discount factors and d1 serves both,
+    for root finders that need f and f' at every step. Vega is 0 at or
+    past expiry and at zero volatility.
+    """
+    if T <= 0 or sigma <= 0:
+        return bs_price_scalar(S, K, T, r, q, sigma, is_call), 0.0
+
+    sqrt_T = math.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    S_dq = S * math.exp(-q * T)
+    K_dr = K * math.exp(-r * T)
+
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+
+    if is_call:
+        value = S_dq * norm_cdf(d1) - K_dr * norm_cdf(d2)
+    else:
+        value = K_dr * norm_cdf(-d2) - S_dq * norm_cdf(-d1)
+
+    return value, S_dq * norm_pdf(d1) * sqrt_T
+
+
+def price(
+    option: OptionContract,
+    market: MarketSnapshot,
+    today: date
+) -> float:
+    """
+    European Black-Scholes price
+    """
+    return bs_price_scalar(
+        market.spot,
+        option.strike,
+        (option.expiry - today).days / 365.0,
+        market.rate,
+        market.dividend_yield,
+        market.volatility,
+        option.option_type == "call",
+    )
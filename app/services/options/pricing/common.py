@@ -1,5 +1,31 @@
 import math
-from scipy.stats import norm
+
+import numpy as np
+from scipy.special import ndtr
+
+# Standard normal CDF: the bare ufunc, without scipy.stats' distribution wrapper
+norm_cdf = ndtr
+
+INV_SQRT_2PI = 0.3989422804014327
+INV_SQRT_2 = 0.7071067811865476
+
+
+def norm_pdf(x):
+    """Standard normal density; works on scalars and arrays."""
+    return INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+# Python-float versions for the scalar kernels: `math` calls skip ufunc
+# dispatch and keep the arithmetic that follows in plain floats.
+
+def scalar_norm_cdf(x: float) -> float:
+    """Standard normal CDF via erfc (accurate in both tails)."""
+    return 0.5 * math.erfc(-x * INV_SQRT_2)
+
+
+def scalar_norm_pdf(x: float) -> float:
+    """Standard normal density of a single float."""
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
 
 
 def d1_d2(S, K, r, q, sigma, T):
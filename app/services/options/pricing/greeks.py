@@ -1,9 +1,12 @@
 import math
 from datetime import date
-from scipy.stats import norm
 
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
+from app.services.options.pricing.common import (
+    scalar_norm_cdf as norm_cdf,
+    scalar_norm_pdf as norm_pdf,
+)
 
 
 def greeks(option: OptionContract, market: MarketSnapshot, today: date) -> dict:
@@ -36,7 +39,7 @@ def greeks(option: OptionContract, market: MarketSnapshot, today: date) -> dict:
 
         return {
             "price_intrinsic": intrinsic,
-            "delta": float(delta),
+            "delta": delta,
             "gamma": 0.0,
             "vega": 0.0,
             "theta": 0.0,
@@ -56,11 +59,11 @@ def greeks(option: OptionContract, market: MarketSnapshot, today: date) -> dict:
             rho = -T * K * math.exp(-r * T) if forward < 0 else 0.0
 
         return {
-            "delta": float(delta),
+            "delta": delta,
             "gamma": 0.0,
             "vega": 0.0,
             "theta": 0.0,
-            "rho": float(rho),
+            "rho": rho,
         }
 
     sqrt_T = math.sqrt(T)
@@ -70,40 +73,40 @@ def greeks(option: OptionContract, market: MarketSnapshot, today: date) -> dict:
     d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * sqrt_T)
     d2 = d1 - sigma * sqrt_T
 
-    pdf_d1 = norm.pdf(d1)
+    pdf_d1 = norm_pdf(d1)
 
     # Common terms
     gamma = disc_q * pdf_d1 / (S * sigma * sqrt_T)
     vega = S * disc_q * pdf_d1 * sqrt_T  # per 1.00 vol
 
     if option.option_type == "call":
-        delta = disc_q * norm.cdf(d1)
-        rho = K * T * disc_r * norm.cdf(d2)  # per 1.00 rate
+        delta = disc_q * norm_cdf(d1)
+        rho = K * T * disc_r * norm_cdf(d2)  # per 1.00 rate
 
         theta_year = (
             - (S * disc_q * pdf_d1 * sigma) / (2.0 * sqrt_T)
-            - r * K * disc_r * norm.cdf(d2)
-            + q * S * disc_q * norm.cdf(d1)
+            - r * K * disc_r * norm_cdf(d2)
+            + q * S * disc_q * norm_cdf(d1)
         )
     else:
-        delta = disc_q * (norm.cdf(d1) - 1.0)
-        rho = -K * T * disc_r * norm.cdf(-d2)  # per 1.00 rate
+        delta = disc_q * (norm_cdf(d1) - 1.0)
+        rho = -K * T * disc_r * norm_cdf(-d2)  # per 1.00 rate
 
         theta_year = (
             - (S * disc_q * pdf_d1 * sigma) / (2.0 * sqrt_T)
-            + r * K * disc_r * norm.cdf(-d2)
-            - q * S * disc_q * norm.cdf(-d1)
+            + r * K * disc_r * norm_cdf(-d2)
+            - q * S * disc_q * norm_cdf(-d1)
         )
 
     theta_day = theta_year / 365.0
 
     return {
-        "delta": float(delta),
-        "gamma": float(gamma),
-        "vega": float(vega),
-        "theta": float(theta_day),
-        "rho": float(rho),
+        "delta": delta,
+        "gamma": gamma,
+        "vega": vega,
+        "theta": theta_day,
+        "rho": rho,
         # helpful extras for debugging/front-end if you want them:
-        "d1": float(d1),
-        "d2": float(d2),
+        "d1": d1,
+        "d2": d2,
     }
@@ -0,0 +1,152 @@
+"""
+Array Black-Scholes kernel.
+
+Same conventions and edge cases as `black_scholes.price` and
+`greeks.greeks`, evaluated element-wise over broadcast NumPy arrays so a
+whole scenario grid is priced in a handful of ufunc calls.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from app.services.options.pricing.common import norm_cdf, norm_pdf
+
+
+def bs_price_greeks(S, K, T, r, q, sigma, is_call, dtype=np.float64, greeks=True) -> Dict[str, np.ndarray]:
+    """
+    European Black-Scholes price and Greeks over broadcast arrays.
+
+    Parameters are array-likes broadcastable against each other; `T` is in
+    years and `is_call` is a boolean mask (False = put). `dtype` sets the
+    working precision (float32 halves memory traffic on large grids).
+    `greeks=False` evaluates and returns only "price".
+
+    Conventions match the scalar kernels:
+    - theta per DAY
+    - vega and rho per 1.00 change in sigma / rate
+    - T <= 0: intrinsic value, step delta, other Greeks 0
+    - sigma <= 0: discounted-forward value, step delta, rho on the ITM side
+    """
+    S, K, T, r, q, sigma = (np.asarray(x, dtype=dtype) for x in (S, K, T, r, q, sigma))
+    is_call = np.asarray(is_call, dtype=bool)
+    shape = np.broadcast_shapes(S.shape, K.shape, T.shape, r.shape, q.shape, sigma.shape, is_call.shape)
+
+    # Inputs are NOT broadcast up front: time/vol-only terms (sqrt(T),
+    # discount factors) are evaluated on their own, smaller shapes and
+    # only expand when combined with spot/strike.
+    expired = T <= 0
+    if expired.all():
+        return _intrinsic(S, K, is_call, shape, greeks)
+
+    zero_vol = ~expired & (sigma <= 0)
+    live = ~expired & ~zero_vol
+
+    # Safe inputs for the live branch; masked lanes are overwritten below
+    T_l = np.where(live, T, 1.0)
+    sig_l = np.where(live, sigma, 1.0)
+
+    # Time/vol-only invariants, computed once on their own shapes
+    sqrt_T = np.sqrt(T_l)
+    vol_sqrt_T = sig_l * sqrt_T
+    drift_T = (r - q + 0.5 * sig_l * sig_l) * T_l
+    disc_q = np.exp(-q * T_l)
+    disc_r = np.exp(-r * T_l)
+
+    # log(S) - log(K) takes one log per spot and per strike instead of
+    # one per (spot, strike) cell of the broadcast grid
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(S) - np.log(K) + drift_T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+
+    # +1 for calls, -1 for puts: N(sign * d) gives N(d1), N(d2) for calls
+    # and N(-d1), N(-d2) for puts, so two CDF passes serve both sides
+    sign = np.where(is_call, 1.0, -1.0).astype(S.dtype)
+    n1 = norm_cdf(sign * d1)
+    n2 = norm_cdf(sign * d2)
+
+    S_dq = S * disc_q
+    K_dr = K * disc_r
+    S_dq_n1 = S_dq * n1
+    K_dr_n2 = K_dr * n2
+
+    price = sign * (S_dq_n1 - K_dr_n2)
+
+    if not greeks:
+        if zero_vol.any():
+            fwd = S * np.exp(-q * T) - K * np.exp(-r * T)
+            price = np.where(zero_vol, np.maximum(sign * fwd, 0.0), price)
+        if expired.any():
+            price = np.where(expired, np.maximum(sign * (S - K), 0.0), price)
+        return {"price": np.broadcast_to(price, shape)}
+
+    pdf_d1 = norm_pdf(d1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = disc_q * pdf_d1 / (S * vol_sqrt_T)
+    vega = S_dq * pdf_d1 * sqrt_T
+    theta_decay = -(S_dq * pdf_d1 * sig_l) / (2.0 * sqrt_T)
+
+    # Put forms follow from N(-x) = 1 - N(x): delta = -e^{-qT} N(-d1), etc.
+    delta = sign * disc_q * n1
+    rho = sign * T_l * K_dr_n2
+    theta_year = theta_decay - sign * (r * K_dr_n2 - q * S_dq_n1)
+    theta = theta_year / 365.0
+
+    if zero_vol.any():
+        dq0 = np.exp(-q * T)
+        dr0 = np.exp(-r * T)
+        fwd = S * dq0 - K * dr0
+        itm = np.where(is_call, fwd > 0, fwd < 0)
+        otm = np.where(is_call, fwd < 0, fwd > 0)
+
+        price = np.where(zero_vol, np.maximum(sign * fwd, 0.0), price)
+        delta = np.where(
+            zero_vol,
+            sign * np.where(itm, dq0, np.where(otm, 0.0, 0.5 * dq0)),
+            delta,
+        )
+        rho = np.where(zero_vol, np.where(itm, sign * T * K * dr0, 0.0), rho)
+
+    if expired.any():
+        moneyness = sign * (S - K)
+
+        price = np.where(expired, np.maximum(moneyness, 0.0), price)
+        delta = np.where(
+            expired,
+            sign * np.where(moneyness > 0, 1.0, np.where(moneyness < 0, 0.0, 0.5)),
+            delta,
+        )
+        rho = np.where(expired, 0.0, rho)
+
+    flat = ~live
+    out = {
+        "price": price,
+        "delta": delta,
+        "gamma": np.where(flat, 0.0, gamma),
+        "vega": np.where(flat, 0.0, vega),
+        "theta": np.where(flat, 0.0, theta),
+        "rho": rho,
+    }
+    return {k: np.broadcast_to(v, shape) for k, v in out.items()}
+
+
+def _intrinsic(S, K, is_call, shape, greeks) -> Dict[str, np.ndarray]:
+    """Expired-option branch of `bs_price_greeks` on its own: no BS terms."""
+    sign = np.where(is_call, 1.0, -1.0).astype(S.dtype)
+    moneyness = sign * (S - K)
+    price = np.maximum(moneyness, 0.0)
+    if not greeks:
+        return {"price": np.broadcast_to(price, shape)}
+
+    zeros = np.zeros((), dtype=price.dtype)
+    delta = sign * np.where(moneyness > 0, 1.0, np.where(moneyness < 0, 0.0, 0.5))
+    out = {
+        "price": price,
+        "delta": delta,
+        "gamma": zeros,
+        "vega": zeros,
+        "theta": zeros,
+        "rho": zeros,
+    }
+    return {k: np.broadcast_to(v, shape) for k, v in out.items()}
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, List, Dict, Optional
+from typing import Iterable, Dict, Sequence
+
+import numpy as np
 
 from app.services.options.core.market_data import MarketSnapshot
-from app.services.options.portfolio.portfolio import Position, portfolio_price, portfolio_greeks
+from app.services.options.portfolio.portfolio import (
+    Position,
+    PositionArrays,
+    pack_positions,
+    portfolio_grid,
+)
 
 
 @dataclass(frozen=True)
@@ -19,13 +26,13 @@ class PayoffConfig:
     - Volatility is taken from the provided 'market' snapshot (flat vol assumption).
     """
     expiry_date: date
-    spots: List[float]
+    spots: np.ndarray | Sequence[float]
     include_value_today: bool = True
     include_greeks_today: bool = False  # optional: delta/gamma/vega/theta at today along the spot grid
 
 
 def payoff_scenario(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     *,
@@ -46,23 +53,20 @@ def payoff_scenario(
       - metadata: assumptions & dates
     """
 
-    if not config.spots:
+    if len(config.spots) == 0:
         raise ValueError("config.spots must be a non-empty list of spot values")
 
     # Sort spots for nicer curves + consistent UI
-    spots = sorted(float(s) for s in config.spots)
+    spot_grid = np.sort(np.asarray(config.spots, dtype=np.float64))
+    spots = spot_grid.tolist()
+
+    # Each curve is one broadcast pass over (spots, positions)
+    book = pack_positions(positions)
 
     # --- Payoff at expiry (portfolio valued at expiry_date)
-    payoff_at_expiry: List[float] = []
-    for s in spots:
-        m_exp = MarketSnapshot(
-            spot=s,
-            rate=market.rate,
-            dividend_yield=market.dividend_yield,
-            volatility=market.volatility,
-            timestamp=str(config.expiry_date),
-        )
-        payoff_at_expiry.append(portfolio_price(positions, m_exp, config.expiry_date))
+    payoff_at_expiry = portfolio_grid(
+        book, market, config.expiry_date, spot=spot_grid, greeks=False
+    )["value"].tolist()
 
     result: Dict = {
         "spots": spots,
@@ -79,49 +83,26 @@ def payoff_scenario(
         },
     }
 
+    if not (config.include_value_today or config.include_greeks_today):
+        return result
+
+    # --- Value and Greeks today share one evaluation on the same grid
+    today_grid = portfolio_grid(
+        book, market, today, spot=spot_grid, greeks=config.include_greeks_today
+    )
+
     # --- Optional: value curve today (same spot grid, valued at 'today')
     if config.include_value_today:
-        value_today: List[float] = []
-        for s in spots:
-            m_today = MarketSnapshot(
-                spot=s,
-                rate=market.rate,
-                dividend_yield=market.dividend_yield,
-                volatility=market.volatility,
-                timestamp=str(today),
-            )
-            value_today.append(portfolio_price(positions, m_today, today))
-        result["value_today"] = value_today
+        result["value_today"] = today_grid["value"].tolist()
 
     # --- Optional: Greeks today along the grid (useful for “risk along payoff” visualization)
     if config.include_greeks_today:
-        deltas: List[float] = []
-        gammas: List[float] = []
-        vegas: List[float] = []
-        thetas: List[float] = []
-        rhos: List[float] = []
-
-        for s in spots:
-            m_today = MarketSnapshot(
-                spot=s,
-                rate=market.rate,
-                dividend_yield=market.dividend_yield,
-                volatility=market.volatility,
-                timestamp=str(today),
-            )
-            g = portfolio_greeks(positions, m_today, today)
-            deltas.append(g["delta"])
-            gammas.append(g["gamma"])
-            vegas.append(g["vega"])
-            thetas.append(g["theta"])
-            rhos.append(g["rho"])
-
         result["greeks_today"] = {
-            "delta": deltas,
-            "gamma": gammas,
-            "vega": vegas,
-            "theta": thetas,
-            "rho": rhos,
+            "delta": today_grid["delta"].tolist(),
+            "gamma": today_grid["gamma"].tolist(),
+            "vega": today_grid["vega"].tolist(),
+            "theta": today_grid["theta"].tolist(),
+            "rho": today_grid["rho"].tolist(),
         }
 
     return result
@@ -133,7 +114,7 @@ def make_spot_grid(
     pct_range: float = 0.5,
     n: int = 101,
     min_spot: float = 0.01,
-) -> List[float]:
+) -> np.ndarray:
     """
     Convenience helper for building a spot grid around current spot.
 
@@ -153,7 +134,7 @@ def make_spot_grid(
 
     Returns
     -------
-    list[float]
+    np.ndarray
     """
     if spot_center <= 0:
         raise ValueError("spot_center must be > 0")
@@ -165,5 +146,4 @@ def make_spot_grid(
     lo = max(min_spot, spot_center * (1.0 - pct_range))
     hi = spot_center * (1.0 + pct_range)
 
-    step = (hi - lo) / (n - 1)
-    return [lo + i * step for i in range(n)]
+    return np.linspace(lo, hi, n)
@@ -1,19 +1,36 @@
 from datetime import date, timedelta
-from typing import Iterable, List, Dict
+from typing import Iterable, List, Dict, Sequence
+
+import numpy as np
 
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.portfolio.portfolio import (
     Position,
-    portfolio_price,
-    portfolio_greeks,
+    PositionArrays,
+    portfolio_grid,
 )
 
+GREEK_KEYS = ("delta", "gamma", "vega", "theta", "rho")
+
+
+def grid_rows(grid: Dict[str, np.ndarray], **leading: Sequence) -> List[Dict]:
+    """
+    Per-point {"value", Greeks...} dicts from a 1-D `portfolio_grid` result.
+
+    `leading` columns (e.g. spot=spots) come first in every row, so each
+    row is built as one dict instead of merged from two.
+    """
+    columns = {**leading, **{k: grid[k].tolist() for k in ("value", *GREEK_KEYS)}}
+    keys = tuple(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
 # -------------------------------------------------
 # SPOT SCENARIO
 # -------------------------------------------------
 
 def spot_scenario(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     spots: List[float],
@@ -21,24 +38,10 @@ def spot_scenario(
     """
     Portfolio value & greeks as function of spot.
     """
-    results = []
+    # Times to expiry are fixed across the sweep: one grid pass
+    grid = portfolio_grid(positions, market, today, spot=np.asarray(spots, dtype=np.float64))
 
-    for s in spots:
-        m = MarketSnapshot(
-            spot=s,
-            rate=market.rate,
-            dividend_yield=market.dividend_yield,
-            volatility=market.volatility,
-            timestamp=market.timestamp,
-        )
-
-        results.append({
-            "spot": s,
-            "value": portfolio_price(positions, m, today),
-            **portfolio_greeks(positions, m, today),
-        })
-
-    return results
+    return grid_rows(grid, spot=spots)
 
 
 # -------------------------------------------------
@@ -46,7 +49,7 @@ def spot_scenario(
 # -------------------------------------------------
 
 def vol_scenario(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     vols: List[float],
@@ -54,24 +57,9 @@ def vol_scenario(
     """
     Portfolio value & greeks as function of volatility.
     """
-    results = []
-
-    for v in vols:
-        m = MarketSnapshot(
-            spot=market.spot,
-            rate=market.rate,
-            dividend_yield=market.dividend_yield,
-            volatility=v,
-            timestamp=market.timestamp,
-        )
-
-        results.append({
-            "volatility": v,
-            "value": portfolio_price(positions, m, today),
-            **portfolio_greeks(positions, m, today),
-        })
+    grid = portfolio_grid(positions, market, today, volatility=np.asarray(vols, dtype=np.float64))
 
-    return results
+    return grid_rows(grid, volatility=vols)
 
 
 # -------------------------------------------------
@@ -79,7 +67,7 @@ def vol_scenario(
 # -------------------------------------------------
 
 def time_scenario(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     days_forward: List[int],
@@ -87,16 +75,14 @@ def time_scenario(
     """
     Portfolio value & greeks as time passes.
     """
-    results = []
-
-    for d in days_forward:
-        t = today + timedelta(days=d)
-
-        results.append({
-            "days_forward": d,
-            "date": t,
-            "value": portfolio_price(positions, market, t),
-            **portfolio_greeks(positions, market, t),
-        })
-
-    return results
+    # Days to expiry come from the packed expiry ordinals once; each
+    # horizon only shifts them
+    grid = portfolio_grid(
+        positions, market, today, days_forward=np.asarray(days_forward, dtype=np.float64)
+    )
+
+    return grid_rows(
+        grid,
+        days_forward=days_forward,
+        date=[today + timedelta(days=d) for d in days_forward],
+    )
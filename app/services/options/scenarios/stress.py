@@ -1,16 +1,19 @@
 from typing import Iterable, List, Dict
 from datetime import date
 
+import numpy as np
+
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.portfolio.portfolio import (
     Position,
-    portfolio_price,
-    portfolio_greeks,
+    PositionArrays,
+    portfolio_grid,
 )
+from app.services.options.scenarios.scenarios import grid_rows
 
 
 def crash_scenario(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     *,
@@ -21,8 +24,8 @@ def crash_scenario(
 
     Parameters
     ----------
-    positions : Iterable[Position]
-        Portfolio positions
+    positions : Iterable[Position] or PositionArrays
+        Portfolio positions (optionally pre-packed)
     market : MarketSnapshot
         Current market state
     today : date
@@ -37,34 +40,11 @@ def crash_scenario(
         Stress scenario results per crash level
     """
 
-    results = []
-
-    for c in crashes:
-        if c >= 0:
-            raise ValueError("Crash percentages must be negative (e.g. -0.25 for -25%)")
-
-        shocked_spot = market.spot * (1.0 + c)
-
-        shocked_market = MarketSnapshot(
-            spot=shocked_spot,
-            rate=market.rate,
-            dividend_yield=market.dividend_yield,
-            volatility=market.volatility,  # flat vol assumption
-            timestamp=market.timestamp,
-        )
-
-        value = portfolio_price(positions, shocked_market, today)
-        g = portfolio_greeks(positions, shocked_market, today)
+    if any(c >= 0 for c in crashes):
+        raise ValueError("Crash percentages must be negative (e.g. -0.25 for -25%)")
 
-        results.append({
-            "crash_pct": c,
-            "spot": shocked_spot,
-            "value": value,
-            "delta": g["delta"],
-            "gamma": g["gamma"],
-            "vega": g["vega"],
-            "theta": g["theta"],
-            "rho": g["rho"],
-        })
+    # Flat vol, fixed valuation date: every crash level in one grid pass
+    shocked_spots = [market.spot * (1.0 + c) for c in crashes]
+    grid = portfolio_grid(positions, market, today, spot=np.asarray(shocked_spots, dtype=np.float64))
 
-    return results
+    return grid_rows(grid, crash_pct=crashes, spot=shocked_spots)
@@ -1,24 +1,154 @@
-from typing import Iterable, List, Dict
-from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Dict, Literal, Tuple
+from datetime import date
+
+import numpy as np
 
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.portfolio.portfolio import (
     Position,
-    portfolio_price,
-    portfolio_greeks,
+    PositionArrays,
+    pack_positions,
+    portfolio_grid,
 )
 
+Precision = Literal["fp32", "fp64"]
+
+PRECISION_DTYPES = {"fp32": np.float32, "fp64": np.float64}
+
+
+def _as_output(grid: np.ndarray):
+    """
+    float64 grids become nested lists; float32 grids stay ndarrays so the
+    orjson response renders them with float32's short repr (tolist() would
+    widen them back to float64 digits).
+    """
+    if grid.dtype == np.float32:
+        return grid
+    return grid.tolist()
+
+
+# Surfaces kept per process. Clients re-request the same grid while
+# toggling unrelated controls; a hit skips the whole kernel pass.
+SURFACE_CACHE_SIZE = 128
+
+# Larger grids are computed uncached, so the cache holds at most
+# SURFACE_CACHE_SIZE x SURFACE_CACHE_MAX_CELLS cells per metric
+SURFACE_CACHE_MAX_CELLS = 10_000
+
+
+def _market_key(market: MarketSnapshot, axis: str) -> Tuple:
+    """
+    The snapshot fields a surface along `axis` actually reads.
+
+    Spot is always a grid axis and volatility is one for the vol surface,
+    so they don't split the cache; neither does the timestamp, which API
+    requests stamp with the current time.
+    """
+    volatility = None if axis == "volatility" else market.volatility
+    return (market.rate, market.dividend_yield, volatility)
+
+
+def _book_key(book: PositionArrays) -> Tuple:
+    """Hashable (strike, expiry ordinal, quantity, is_call) rows of a packed book."""
+    return tuple(zip(
+        book.strike.tolist(),
+        book.expiry_ordinal.tolist(),
+        book.quantity.tolist(),
+        book.is_call.tolist(),
+    ))
+
+
+def _compute_surface_grid(
+    book_key: Tuple,
+    market_key: Tuple,
+    today: date,
+    spots: Tuple[float, ...],
+    axis: str,
+    columns: Tuple[float, ...],
+    precision: Precision,
+) -> Dict[str, np.ndarray]:
+    """
+    `portfolio_grid` over spots (rows) x `axis` values (columns).
+
+    `axis` is "volatility" or "days_forward". The arrays are made
+    read-only so a caller can't alter what later cache hits receive.
+    """
+    n = len(book_key)
+    strike, expiry_ordinal, quantity, is_call = zip(*book_key) if n else ((), (), (), ())
+    book = PositionArrays(
+        strike=np.array(strike, dtype=np.float64),
+        expiry_ordinal=np.array(expiry_ordinal, dtype=np.int64),
+        quantity=np.array(quantity, dtype=np.float64),
+        is_call=np.array(is_call, dtype=np.bool_),
+    )
+    rate, dividend_yield, volatility = market_key
+    # Spot (and volatility on the vol axis) come from the grid axes
+    market = MarketSnapshot(
+        spot=0.0,
+        rate=rate,
+        dividend_yield=dividend_yield,
+        volatility=0.0 if volatility is None else volatility,
+        timestamp="",
+    )
+
+    grid = portfolio_grid(
+        book,
+        market,
+        today,
+        spot=np.asarray(spots, dtype=np.float64)[:, None],
+        **{axis: np.asarray(columns, dtype=np.float64)[None, :]},
+        dtype=PRECISION_DTYPES[precision],
+    )
+    for arr in grid.values():
+        arr.flags.writeable = False
+    return grid
+
+
+_cached_surface_grid = lru_cache(maxsize=SURFACE_CACHE_SIZE)(_compute_surface_grid)
+
+
+def _surface_grid(
+    positions: Iterable[Position] | PositionArrays,
+    market: MarketSnapshot,
+    today: date,
+    spots: List[float],
+    axis: str,
+    columns: List[float],
+    precision: Precision,
+) -> Dict[str, np.ndarray]:
+    """Surface grid, served from the cache when it fits the cell budget."""
+    args = (
+        _book_key(pack_positions(positions)),
+        _market_key(market, axis),
+        today,
+        tuple(spots),
+        axis,
+        tuple(columns),
+        precision,
+    )
+    if len(spots) * len(columns) > SURFACE_CACHE_MAX_CELLS:
+        return _compute_surface_grid(*args)
+    return _cached_surface_grid(*args)
+
+
+def clear_surface_cache() -> None:
+    """Drop every cached surface grid."""
+    _cached_surface_grid.cache_clear()
+
+
 # =====================================================
 # Spot × Volatility Surface
 # =====================================================
 
 def spot_vol_surface(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     *,
     spots: List[float],
     vols: List[float],
+    precision: Precision = "fp64",
 ) -> Dict:
     """
     Evaluate portfolio metrics on a Spot × Volatility grid.
@@ -26,48 +156,22 @@ def spot_vol_surface(
     Rows correspond to spots
     Columns correspond to volatilities
 
+    precision="fp32" evaluates in single precision for display-only use
+    and returns the grids as float32 arrays, unless a leg is within
+    SHORT_EXPIRY_YEARS of expiry (then the grid is computed in float64).
+
     Returns frontend-ready surface data.
     """
 
-    values = []
-    delta = []
-    gamma = []
-    vega = []
-
-    for s in spots:
-        row_val = []
-        row_delta = []
-        row_gamma = []
-        row_vega = []
-
-        for v in vols:
-            m = MarketSnapshot(
-                spot=s,
-                rate=market.rate,
-                dividend_yield=market.dividend_yield,
-                volatility=v,
-                timestamp=market.timestamp,
-            )
-
-            row_val.append(portfolio_price(positions, m, today))
-
-            g = portfolio_greeks(positions, m, today)
-            row_delta.append(g["delta"])
-            row_gamma.append(g["gamma"])
-            row_vega.append(g["vega"])
-
-        values.append(row_val)
-        delta.append(row_delta)
-        gamma.append(row_gamma)
-        vega.append(row_vega)
+    grid = _surface_grid(positions, market, today, spots, "volatility", vols, precision)
 
     return {
         "spots": spots,
         "vols": vols,
-        "value": values,
-        "delta": delta,
-        "gamma": gamma,
-        "vega": vega,
+        "value": _as_output(grid["value"]),
+        "delta": _as_output(grid["delta"]),
+        "gamma": _as_output(grid["gamma"]),
+        "vega": _as_output(grid["vega"]),
     }
 
 
@@ -76,59 +180,34 @@ def spot_vol_surface(
 # =====================================================
 
 def spot_time_surface(
-    positions: Iterable[Position],
+    positions: Iterable[Position] | PositionArrays,
     market: MarketSnapshot,
     today: date,
     *,
     spots: List[float],
     days_forward: List[int],
+    precision: Precision = "fp64",
 ) -> Dict:
     """
     Evaluate portfolio metrics on a Spot × Time grid.
 
     Rows correspond to spots
     Columns correspond to days forward
-    """
-
-    values = []
-    delta = []
-    gamma = []
-    theta = []
-
-    for s in spots:
-        row_val = []
-        row_delta = []
-        row_gamma = []
-        row_theta = []
 
-        for d in days_forward:
-            future_date = today + timedelta(days=d)
-
-            m = MarketSnapshot(
-                spot=s,
-                rate=market.rate,
-                dividend_yield=market.dividend_yield,
-                volatility=market.volatility,
-                timestamp=str(future_date),
-            )
-
-            row_val.append(portfolio_price(positions, m, future_date))
-
-            g = portfolio_greeks(positions, m, future_date)
-            row_delta.append(g["delta"])
-            row_gamma.append(g["gamma"])
-            row_theta.append(g["theta"])
+    precision="fp32" evaluates in single precision for display-only use
+    and returns the grids as float32 arrays, unless a leg is within
+    SHORT_EXPIRY_YEARS of expiry (then the grid is computed in float64).
+    """
 
-        values.append(row_val)
-        delta.append(row_delta)
-        gamma.append(row_gamma)
-        theta.append(row_theta)
+    # Time-only terms are evaluated per (horizon, position) and broadcast
+    # against the spot axis inside the kernel.
+    grid = _surface_grid(positions, market, today, spots, "days_forward", days_forward, precision)
 
     return {
         "spots": spots,
         "days_forward": days_forward,
-        "value": values,
-        "delta": delta,
-        "gamma": gamma,
-        "theta": theta,
+        "value": _as_output(grid["value"]),
+        "delta": _as_output(grid["delta"]),
+        "gamma": _as_output(grid["gamma"]),
+        "theta": _as_output(grid["theta"]),
     }
@@ -1,8 +1,11 @@
+import math
 from datetime import date
 
+from scipy.stats import norm
+
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
-from app.services.options.pricing.black_scholes import price
+from app.services.options.pricing.black_scholes import bs_price_scalar, bs_price_vega_scalar, price
 
 
 TODAY = date(2026, 1, 22)
@@ -136,3 +139,35 @@ def test_zero_volatility_put_equals_discounted_forward_payoff():
     p = price(option, market, TODAY)
 
     assert p >= 0.0
+
+
+# ---------- REFERENCE ----------
+
+def test_scalar_kernel_matches_scipy_reference():
+    r, q, T = 0.03, 0.005, 0.4
+    for S in (50.0, 180.0, 400.0):
+        for K in (100.0, 180.0, 260.0):
+            for sigma in (0.05, 0.25, 1.5):
+                d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
+                d2 = d1 - sigma * math.sqrt(T)
+                call = S * math.exp(-q * T) * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
+                put = K * math.exp(-r * T) * norm.cdf(-d2) - S * math.exp(-q * T) * norm.cdf(-d1)
+
+                assert math.isclose(bs_price_scalar(S, K, T, r, q, sigma, True), call, rel_tol=1e-12, abs_tol=1e-12)
+                assert math.isclose(bs_price_scalar(S, K, T, r, q, sigma, False), put, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_price_vega_kernel_matches_price_and_scipy_vega():
+    r, q, T = 0.03, 0.005, 0.4
+    for S in (50.0, 180.0, 400.0):
+        for K in (100.0, 180.0, 260.0):
+            for sigma in (0.05, 0.25, 1.5):
+                d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
+                vega = S * math.exp(-q * T) * norm.pdf(d1) * math.sqrt(T)
+                for is_call in (True, False):
+                    p, v = bs_price_vega_scalar(S, K, T, r, q, sigma, is_call)
+
+                    assert math.isclose(p, bs_price_scalar(S, K, T, r, q, sigma, is_call), rel_tol=1e-12, abs_tol=1e-12)
+                    assert math.isclose(v, vega, rel_tol=1e-12, abs_tol=1e-12)
+
+    assert bs_price_vega_scalar(185.0, 180.0, 0.0, r, q, 0.25, True) == (5.0, 0.0)
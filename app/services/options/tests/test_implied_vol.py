@@ -1,9 +1,17 @@
 from datetime import date
 
+import numpy as np
+import pytest
+
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.pricing.black_scholes import price
-from app.services.options.volatility.implied_vol import implied_vol
+from app.services.options.volatility.implied_vol import (
+    ImpliedVolError,
+    _initial_sigma_guess,
+    implied_vol,
+    implied_vol_batch,
+)
 
 
 TODAY = date(2026, 1, 22)
@@ -77,3 +85,108 @@ def test_implied_vol_rejects_zero_price():
         assert False
     except Exception:
         assert True
+
+
+# ---------- INITIAL GUESS ----------
+
+def test_closed_form_guess_lands_near_true_vol():
+    option = make_call()
+    T = (option.expiry - TODAY).days / 365.0
+
+    for true_vol in (0.10, 0.35, 1.20):
+        market_price = price(option, make_market(true_vol), TODAY)
+        guess = _initial_sigma_guess(market_price, 185, 180, T, 0.03, 0.005, True)
+
+        assert abs(guess - true_vol) < 0.05 * true_vol
+
+
+def test_implied_vol_round_trip_puts_across_strikes():
+    for strike in (120, 180, 250):
+        option = OptionContract(
+            symbol="AAPL",
+            option_type="put",
+            style="european",
+            strike=strike,
+            expiry=date(2026, 6, 19),
+            quantity=1.0,
+        )
+        market_price = price(option, make_market(0.45), TODAY)
+
+        implied = implied_vol(market_price, option, make_market(0.20), TODAY)
+
+        assert abs(implied - 0.45) < 1e-4
+
+
+# ---------- BRACKETING ----------
+
+def test_implied_vol_converges_from_poor_guesses():
+    option = make_call()
+    market_price = price(option, make_market(0.35), TODAY)
+
+    for guess in (1e-5, 0.01, 4.9):
+        implied = implied_vol(market_price, option, make_market(0.20), TODAY, initial_guess=guess)
+        assert abs(implied - 0.35) < 1e-4
+
+
+def test_implied_vol_rejects_prices_outside_arbitrage_bounds():
+    option = make_call()
+    market = make_market(0.25)
+
+    with pytest.raises(ImpliedVolError):
+        implied_vol(190.0, option, market, TODAY)  # above the discounted spot
+    with pytest.raises(ImpliedVolError):
+        implied_vol(1.0, option, market, TODAY)  # below the discounted intrinsic
+
+
+# ---------- BATCH ----------
+
+def test_implied_vol_batch_matches_scalar_solver_on_a_surface():
+    # Strikes/expiries with vega well above zero, so a price within `tol`
+    # pins sigma down (deep OTM short-dated quotes are ill-conditioned)
+    strikes = np.array([160.0, 180.0, 200.0])
+    expiries = [date(2026, 3, 20), date(2026, 6, 19), date(2027, 1, 15)]
+    true_vols = np.array([[0.25, 0.35, 0.60]] * len(expiries))
+
+    options = [
+        [
+            OptionContract(
+                symbol="AAPL",
+                option_type="call" if strike >= 180 else "put",
+                style="european",
+                strike=strike,
+                expiry=expiry,
+                quantity=1.0,
+            )
+            for strike in strikes
+        ]
+        for expiry in expiries
+    ]
+    prices = np.array([
+        [price(option, make_market(true_vols[i, j]), TODAY) for j, option in enumerate(row)]
+        for i, row in enumerate(options)
+    ])
+
+    T = np.array([[(e - TODAY).days / 365.0] for e in expiries])
+    implied = implied_vol_batch(prices, 185, strikes, T, 0.03, 0.005, strikes >= 180)
+
+    assert implied.shape == prices.shape
+    for i, row in enumerate(options):
+        for j, option in enumerate(row):
+            scalar = implied_vol(prices[i, j], option, make_market(0.20), TODAY)
+            assert abs(implied[i, j] - scalar) < 1e-6
+    assert np.allclose(implied, true_vols, atol=1e-4)
+
+
+def test_implied_vol_batch_marks_unsolvable_quotes_nan():
+    implied = implied_vol_batch(
+        [0.0, 190.0, 1.0, 5.0, 12.0],
+        185,
+        180,
+        [0.4, 0.4, 0.4, 0.0, 0.4],
+        0.03,
+        0.005,
+        True,
+    )
+
+    assert np.isnan(implied[:4]).all()
+    assert np.isfinite(implied[4])
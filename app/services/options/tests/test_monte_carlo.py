@@ -1,5 +1,7 @@
 from datetime import date
 
+import numpy as np
+
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.portfolio.portfolio import Position
@@ -189,3 +191,38 @@ def test_seed_reproducibility():
     )
 
     assert r1["percentiles"] == r2["percentiles"]
+
+
+def test_antithetic_paths_keep_requested_count():
+    result = monte_carlo_scenario(
+        make_strategy(),
+        make_market(),
+        TODAY,
+        horizon_days=30,
+        n_sims=1_001,
+        seed=5,
+        return_samples=True,
+    )
+
+    assert isinstance(result["samples"], np.ndarray)
+    assert len(result["samples"]) == 1_001
+
+
+def test_threaded_revaluation_matches_single_pass():
+    kwargs = dict(horizon_days=30, n_sims=100_001, seed=3, return_samples=True)
+    single = monte_carlo_scenario(make_strategy(), make_market(), TODAY, **kwargs)
+    threaded = monte_carlo_scenario(make_strategy(), make_market(), TODAY, n_threads=4, **kwargs)
+
+    assert np.allclose(threaded["samples"], single["samples"], rtol=1e-12, atol=1e-12)
+    assert abs(threaded["tail_risk"]["cvar_95"] - single["tail_risk"]["cvar_95"]) < 1e-9
+
+
+def test_float32_paths_agree_statistically_with_float64():
+    kwargs = dict(horizon_days=30, n_sims=50_000, seed=11, return_samples=True)
+    full = monte_carlo_scenario(make_strategy(), make_market(), TODAY, **kwargs)
+    single = monte_carlo_scenario(make_strategy(), make_market(), TODAY, dtype=np.float32, **kwargs)
+
+    assert single["samples"].dtype == np.float64
+    std = full["summary"]["std"]
+    assert abs(single["summary"]["mean"] - full["summary"]["mean"]) < 0.05 * std
+    assert abs(single["summary"]["std"] - std) < 0.05 * std
@@ -1,5 +1,8 @@
+from dataclasses import replace
 from datetime import date
 
+from app.services.options.portfolio import portfolio as portfolio_module
+
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.portfolio.portfolio import (
@@ -7,6 +10,9 @@ from app.services.options.portfolio.portfolio import (
     portfolio_price,
     portfolio_greeks,
     delta_hedge_shares,
+    net_positions,
+    pack_positions,
+    portfolio_grid,
 )
 from app.services.options.pricing.black_scholes import price as bs_price
 from app.services.options.pricing.greeks import greeks as bs_greeks
@@ -124,3 +130,87 @@ def test_short_position_flips_signs():
 
     for k in long_g:
         assert abs(short_g[k] + long_g[k]) < 1e-10
+
+
+def test_net_positions_merges_identical_contracts():
+    call = make_call()
+    put = make_put()
+    market = make_market()
+
+    positions = [Position(call, 1.0), Position(put, 2.0), Position(call, -3.0)]
+    netted = net_positions(positions)
+
+    assert netted == [Position(call, -2.0), Position(put, 2.0)]
+    assert abs(portfolio_price(netted, market, TODAY) - portfolio_price(positions, market, TODAY)) < 1e-10
+
+    g_net = portfolio_greeks(netted, market, TODAY)
+    g_raw = portfolio_greeks(positions, market, TODAY)
+    for k in g_raw:
+        assert abs(g_net[k] - g_raw[k]) < 1e-10
+
+
+def test_portfolio_grid_matches_pointwise_evaluation():
+    positions = [Position(make_call(), 1.0), Position(make_put(strike=160), -2.0)]
+    market = make_market()
+    spots = [150.0, 185.0, 220.0]
+    vols = [0.15, 0.35]
+
+    grid = portfolio_grid(positions, market, TODAY, spot=[[s] for s in spots], volatility=[vols])
+
+    for i, s in enumerate(spots):
+        for j, v in enumerate(vols):
+            m = replace(market, spot=s, volatility=v)
+            assert abs(grid["value"][i, j] - portfolio_price(positions, m, TODAY)) < 1e-10
+            g = portfolio_greeks(positions, m, TODAY)
+            for k in g:
+                assert abs(grid[k][i, j] - g[k]) < 1e-10
+
+
+def test_pack_positions_is_reusable_across_valuation_dates():
+    positions = [Position(make_call(), 2.0), Position(make_put(strike=160), -1.0)]
+    book = pack_positions(positions)
+    market = make_market()
+
+    assert len(book) == 2
+    assert book.is_call.tolist() == [True, False]
+    assert book.quantity.tolist() == [2.0, -1.0]
+
+    for today in (TODAY, date(2026, 3, 1)):
+        packed = portfolio_grid(book, market, today)
+        unpacked = portfolio_grid(positions, market, today)
+        for k in packed:
+            assert packed[k] == unpacked[k]
+
+
+def test_portfolio_grid_mixed_expired_and_live_book():
+    positions = [
+        Position(make_call(), 1.0),
+        Position(make_put(strike=200, expiry=date(2026, 1, 1)), -1.5),
+        Position(make_call(strike=170, expiry=TODAY), 2.0),
+    ]
+    market = make_market()
+    spots = [150.0, 185.0, 220.0]
+
+    grid = portfolio_grid(positions, market, TODAY, spot=spots)
+
+    for i, s in enumerate(spots):
+        m = replace(market, spot=s)
+        assert abs(grid["value"][i] - portfolio_price(positions, m, TODAY)) < 1e-10
+        g = portfolio_greeks(positions, m, TODAY)
+        for k in g:
+            assert abs(grid[k][i] - g[k]) < 1e-10
+
+
+def test_portfolio_grid_tiles_positions_without_changing_results(monkeypatch):
+    positions = [Position(make_call(strike=k), 1.0) for k in (160, 170, 180)]
+    positions += [Position(make_put(strike=k), -0.5) for k in (175, 190)]
+    market = make_market()
+    spots = [[150.0], [185.0], [220.0]]
+    vols = [[0.15, 0.35]]
+
+    whole = portfolio_grid(positions, market, TODAY, spot=spots, volatility=vols)
+    monkeypatch.setattr(portfolio_module, "GRID_TILE_ELEMENTS", 12)
+    tiled = portfolio_grid(positions, market, TODAY, spot=spots, volatility=vols)
+
+    for k in whole:
+        assert abs(tiled[k] - whole[k]).max() < 1e-10
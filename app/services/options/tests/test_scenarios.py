@@ -1,8 +1,8 @@
-from datetime import date
+from datetime import date, timedelta
 
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
-from app.services.options.portfolio.portfolio import Position
+from app.services.options.portfolio.portfolio import Position, portfolio_greeks, portfolio_price
 from app.services.options.scenarios.scenarios import (
     spot_scenario,
     vol_scenario,
@@ -198,3 +198,25 @@ def test_time_scenario_gamma_decreases_near_expiry():
     gamma_later = results[1]["gamma"]
 
     assert gamma_later <= gamma_now
+
+
+def test_scenarios_accept_one_shot_iterables():
+    strategy = make_strategy()
+    market = make_market()
+
+    listed = spot_scenario(strategy, market, TODAY, spots=[170, 200])
+    generated = spot_scenario((p for p in strategy), market, TODAY, spots=[170, 200])
+
+    assert generated == listed
+
+
+def test_time_scenario_matches_pointwise_pricing():
+    strategy = make_strategy()
+    market = make_market()
+
+    for r in time_scenario(strategy, market, TODAY, days_forward=[0, 30, 200]):
+        t = TODAY + timedelta(days=r["days_forward"])
+        assert r["date"] == t
+        assert abs(r["value"] - portfolio_price(strategy, market, t)) < 1e-10
+        for k, v in portfolio_greeks(strategy, market, t).items():
+            assert abs(r[k] - v) < 1e-10
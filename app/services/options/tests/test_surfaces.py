@@ -1,9 +1,15 @@
+from dataclasses import replace
 from datetime import date
 
+import numpy as np
+
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
 from app.services.options.portfolio.portfolio import Position
+from app.services.options.scenarios import surfaces as surfaces_module
 from app.services.options.scenarios.surfaces import (
+    _cached_surface_grid,
+    clear_surface_cache,
     spot_vol_surface,
     spot_time_surface,
 )
@@ -158,3 +164,78 @@ def test_spot_time_surface_value_changes_over_time():
     )
 
     assert surface["value"][0][0] != surface["value"][0][1]
+
+
+# --------------------------------------------------
+# REDUCED PRECISION
+# --------------------------------------------------
+
+def test_fp32_surfaces_track_fp64_reference():
+    positions = make_strategy()
+    market = make_market()
+    spots = [120, 150, 185, 220, 260]
+
+    pairs = [
+        (
+            spot_vol_surface(positions, market, TODAY, spots=spots, vols=[0.1, 0.25, 0.6]),
+            spot_vol_surface(positions, market, TODAY, spots=spots, vols=[0.1, 0.25, 0.6], precision="fp32"),
+        ),
+        (
+            spot_time_surface(positions, market, TODAY, spots=spots, days_forward=[0, 30, 140]),
+            spot_time_surface(positions, market, TODAY, spots=spots, days_forward=[0, 30, 140], precision="fp32"),
+        ),
+    ]
+
+    for ref, low in pairs:
+        for k in ("value", "delta", "gamma"):
+            assert low[k].dtype == np.float32
+            assert np.allclose(low[k], ref[k], rtol=1e-4, atol=1e-4), k
+
+
+def test_fp32_surfaces_fall_back_to_fp64_near_expiry():
+    positions = make_strategy()
+    market = make_market()
+    spots = [175, 180, 185]
+    # 147 days forward leaves the June legs a single day to expiry
+    days = [0, 147]
+
+    ref = spot_time_surface(positions, market, TODAY, spots=spots, days_forward=days)
+    low = spot_time_surface(positions, market, TODAY, spots=spots, days_forward=days, precision="fp32")
+
+    for k in ("value", "delta", "gamma"):
+        assert np.allclose(low[k], ref[k], rtol=0, atol=1e-12), k
+
+
+# --------------------------------------------------
+# CACHE
+# --------------------------------------------------
+
+def test_repeated_surface_requests_hit_the_cache():
+    clear_surface_cache()
+    spots = [150, 185, 220]
+
+    first = spot_vol_surface(make_strategy(), make_market(), TODAY, spots=spots, vols=[0.2, 0.4])
+    # Different timestamp, and a market vol the vol axis overrides: still a hit
+    restamped = replace(make_market(), timestamp="2026-01-22T15:30:00", volatility=0.4)
+    again = spot_vol_surface(make_strategy(), restamped, TODAY, spots=spots, vols=[0.2, 0.4])
+    other = spot_vol_surface(make_strategy(), make_market(), TODAY, spots=spots, vols=[0.2, 0.5])
+
+    info = _cached_surface_grid.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+    assert again == first
+    assert other["value"] != first["value"]
+
+    # Cached float32 grids are handed out read-only
+    low = spot_time_surface(make_strategy(), make_market(), TODAY, spots=spots, days_forward=[0, 30], precision="fp32")
+    assert not low["value"].flags.writeable
+
+
+def test_surfaces_over_the_cell_budget_are_not_cached(monkeypatch):
+    clear_surface_cache()
+    monkeypatch.setattr(surfaces_module, "SURFACE_CACHE_MAX_CELLS", 4)
+
+    small = spot_vol_surface(make_strategy(), make_market(), TODAY, spots=[150, 185], vols=[0.2, 0.4])
+    large = spot_vol_surface(make_strategy(), make_market(), TODAY, spots=[150, 185, 220], vols=[0.2, 0.4])
+
+    assert _cached_surface_grid.cache_info().currsize == 1
+    assert large["value"][:2] == small["value"]
@@ -0,0 +1,90 @@
+from datetime import date
+
+from app.services.options.core.market_data import MarketSnapshot
+from app.services.options.pricing.black_scholes import bs_price_scalar
+from app.services.options.timeline import compute_strategy_timeline
+
+
+MARKET = MarketSnapshot(spot=150.0, rate=0.03, dividend_yield=0.0, volatility=0.25, timestamp="2026-01-02")
+
+
+def run_timeline(positions):
+    return compute_strategy_timeline(
+        positions=positions,
+        market=MARKET,
+        symbol="AAPL",
+        start_date=date(2026, 1, 2),
+        end_date=date(2026, 3, 31),
+    )
+
+
+def test_option_values_follow_entry_pricing_and_expiry():
+    positions = [
+        {"symbol": "AAPL", "type": "call", "strike": 150.0, "expiry": "2026-02-20",
+         "quantity": 2.0, "entry_date": "2026-01-15"},
+    ]
+    result = run_timeline(positions)
+    values = result["instruments"]["opt_0"]
+
+    assert len(values) == len(result["dates"])
+    for d, spot, v in zip(result["dates"], result["underlying"], values):
+        today = date.fromisoformat(d)
+        if today < date(2026, 1, 15):
+            assert v == 0.0
+        elif today > date(2026, 2, 20):
+            assert v == 2.0 * max(spot - 150.0, 0.0)
+        else:
+            T = (date(2026, 2, 20) - today).days / 365.0
+            expected = 2.0 * bs_price_scalar(spot, 150.0, T, 0.03, 0.0, 0.25, True)
+            assert abs(v - expected) < 1e-10
+
+
+def test_flat_capital_before_entry():
+    positions = [
+        {"symbol": "AAPL", "type": "put", "strike": 140.0, "expiry": "2026-03-20",
+         "quantity": 1.0, "entry_date": "2026-02-02", "entry_price": 3.0},
+    ]
+    result = run_timeline(positions)
+
+    first = result["dates"].index("2026-02-02")
+    assert result["portfolio_total"][:first] == [3.0] * first
+    assert result["portfolio_total"][first] == result["instruments"]["opt_0"][first]
+    assert len(result["buy_and_hold"]) == len(result["dates"])
+
+
+def test_model_premium_at_entry_sets_capital():
+    positions = [
+        {"symbol": "AAPL", "type": "call", "strike": 155.0, "expiry": "2026-03-20",
+         "quantity": 3.0, "entry_date": "2026-02-02"},
+    ]
+    result = run_timeline(positions)
+
+    first = result["dates"].index("2026-02-02")
+    spot = result["underlying"][first]
+    premium = 3.0 * bs_price_scalar(spot, 155.0, 46 / 365.0, 0.03, 0.0, 0.25, True)
+    assert all(abs(v - premium) < 1e-10 for v in result["portfolio_total"][:first])
+
+
+def test_stock_leg_after_an_option():
+    positions = [
+        {"symbol": "AAPL", "type": "call", "strike": 150.0, "expiry": "2026-03-20",
+         "quantity": 1.0, "entry_date": "2026-01-15", "entry_price": 5.0},
+        {"symbol": "AAPL", "type": "stock", "quantity": 10},
+    ]
+    result = run_timeline(positions)
+
+    assert result["instruments"]["stock"] == [10 * s for s in result["underlying"]]
+    first_spot = result["underlying"][0]
+    assert abs(result["buy_and_hold"][0] - (5.0 + 10 * first_spot)) < 1e-9
+
+
+def test_off_calendar_dates_take_the_nearest_trading_day_spot():
+    positions = [
+        {"symbol": "AAPL", "type": "call", "strike": 150.0, "expiry": "2026-03-21",
+         "quantity": 1.0, "entry_date": "2026-01-18"},
+    ]
+    result = run_timeline(positions)
+    spot = dict(zip(result["dates"], result["underlying"]))
+
+    assert spot["2026-01-18"] == spot["2026-01-19"]  # Sunday -> Monday
+    assert spot["2026-03-21"] == spot["2026-03-20"]  # Saturday -> Friday
@@ -0,0 +1,95 @@
+from datetime import date
+
+import numpy as np
+
+from app.services.options.core.instruments import OptionContract
+from app.services.options.core.market_data import MarketSnapshot
+from app.services.options.pricing.black_scholes import price
+from app.services.options.pricing.greeks import greeks
+from app.services.options.pricing.vectorized import bs_price_greeks
+
+
+TODAY = date(2026, 1, 22)
+GREEKS = ("delta", "gamma", "vega", "theta", "rho")
+
+
+def make_option(option_type, strike=180, expiry=date(2026, 6, 19)):
+    return OptionContract(
+        symbol="AAPL",
+        option_type=option_type,
+        style="european",
+        strike=strike,
+        expiry=expiry,
+        quantity=1.0,
+    )
+
+
+def make_market(spot=185, vol=0.25, rate=0.03, div=0.005):
+    return MarketSnapshot(
+        spot=spot,
+        rate=rate,
+        dividend_yield=div,
+        volatility=vol,
+        timestamp="2026-01-22",
+    )
+
+
+def assert_matches_scalar(option, market):
+    T = (option.expiry - TODAY).days / 365.0
+    out = bs_price_greeks(
+        market.spot,
+        option.strike,
+        T,
+        market.rate,
+        market.dividend_yield,
+        market.volatility,
+        option.option_type == "call",
+    )
+    expected = greeks(option, market, TODAY)
+
+    assert np.isclose(out["price"], price(option, market, TODAY), rtol=1e-12, atol=1e-12)
+    for k in GREEKS:
+        assert np.isclose(out[k], expected[k], rtol=1e-12, atol=1e-12), k
+
+
+def test_matches_scalar_kernels_live_options():
+    for option_type in ("call", "put"):
+        for strike in (120, 180, 185, 250):
+            for spot in (100, 185, 300):
+                assert_matches_scalar(make_option(option_type, strike), make_market(spot=spot))
+
+
+def test_matches_scalar_kernels_expired_and_at_expiry():
+    for option_type in ("call", "put"):
+        for expiry in (TODAY, date(2026, 1, 1)):
+            for spot in (170, 180, 190):
+                assert_matches_scalar(make_option(option_type, expiry=expiry), make_market(spot=spot))
+
+
+def test_matches_scalar_kernels_zero_vol():
+    for option_type in ("call", "put"):
+        for spot in (150, 210):
+            assert_matches_scalar(make_option(option_type), make_market(spot=spot, vol=0.0))
+
+
+def test_broadcasts_over_grid():
+    spots = np.array([150.0, 185.0, 220.0])[:, None]
+    vols = np.array([0.1, 0.2, 0.3, 0.4])[None, :]
+
+    out = bs_price_greeks(spots, 180.0, 0.5, 0.03, 0.0, vols, True)
+
+    for k in ("price",) + GREEKS:
+        assert out[k].shape == (3, 4)
+
+
+def test_price_only_matches_full_evaluation():
+    spots = np.array([150.0, 180.0, 220.0])[:, None]
+    T = np.array([-0.1, 0.0, 0.5, 0.5, 1.0])
+    sigma = np.array([0.25, 0.25, 0.0, 0.25, 0.4])
+    is_call = np.array([True, False, True, False, True])
+
+    full = bs_price_greeks(spots, 180.0, T, 0.03, 0.005, sigma, is_call)
+    price_only = bs_price_greeks(spots, 180.0, T, 0.03, 0.005, sigma, is_call, greeks=False)
+
+    assert set(price_only) == {"price"}
+    np.testing.assert_array_equal(price_only["price"], full["price"])
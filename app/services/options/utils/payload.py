@@ -0,0 +1,14 @@
+from typing import Any, Mapping
+
+
+def field(payload: Any, name: str, default: Any = None) -> Any:
+    """
+    Read a field from a JSON-style payload.
+
+    Accepts plain dicts (tests, internal callers) as well as the validated
+    Pydantic request models, which the API layer passes straight through
+    instead of round-tripping them via model_dump().
+    """
+    if isinstance(payload, Mapping):
+        return payload.get(name, default)
+    return getattr(payload, name, default)
@@ -1,29 +1,99 @@
 import math
 from datetime import date
+from typing import Optional
+
+import numpy as np
 
 from app.services.options.core.instruments import OptionContract
 from app.services.options.core.market_data import MarketSnapshot
-from app.services.options.pricing.black_scholes import price
-from app.services.options.pricing.greeks import greeks
+from app.services.options.pricing.black_scholes import bs_price_vega_scalar
+from app.services.options.pricing.vectorized import bs_price_greeks
 
 
 class ImpliedVolError(Exception):
     pass
 
 
+# Fallback starting point when the closed-form guess is unusable
+DEFAULT_SIGMA_GUESS = 0.2
+
+# Volatility bracket searched by `implied_vol`
+SIGMA_MIN = 1e-6
+SIGMA_MAX = 5.0
+
+
+def _initial_sigma_guess(
+    market_price: float,
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    q: float,
+    is_call: bool,
+) -> float:
+    """
+    Corrado-Miller closed-form approximation of implied volatility.
+
+    Exact at the money and close over a wide moneyness range, so Newton
+    starts a few steps from the root instead of at a flat 20%. Puts go
+    through put-call parity.
+    """
+    S_dq = S * math.exp(-q * T)
+    K_dr = K * math.exp(-r * T)
+    call_price = market_price if is_call else market_price + S_dq - K_dr
+
+    half_gap = 0.5 * (S_dq - K_dr)
+    excess = call_price - half_gap
+    radicand = excess * excess - (S_dq - K_dr) ** 2 / math.pi
+    sigma = (
+        math.sqrt(2.0 * math.pi) / (S_dq + K_dr)
+        * (excess + math.sqrt(max(radicand, 0.0)))
+        / math.sqrt(T)
+    )
+
+    if not math.isfinite(sigma) or sigma <= 0:
+        return DEFAULT_SIGMA_GUESS
+    return min(sigma, SIGMA_MAX)
+
+
+def _initial_sigma_guess_array(market_price, S_dq, K_dr, T, is_call) -> np.ndarray:
+    """`_initial_sigma_guess` over arrays of quotes (discounted S and K given)."""
+    call_price = np.where(is_call, market_price, market_price + S_dq - K_dr)
+
+    gap = S_dq - K_dr
+    excess = call_price - 0.5 * gap
+    radicand = excess * excess - gap * gap / math.pi
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = (
+            math.sqrt(2.0 * math.pi) / (S_dq + K_dr)
+            * (excess + np.sqrt(np.maximum(radicand, 0.0)))
+            / np.sqrt(T)
+        )
+
+    usable = np.isfinite(sigma) & (sigma > 0)
+    return np.where(usable, np.minimum(sigma, SIGMA_MAX), DEFAULT_SIGMA_GUESS)
+
+
 def implied_vol(
     market_price: float,
     option: OptionContract,
     market: MarketSnapshot,
     today: date,
     *,
-    initial_guess: float = 0.2,
+    initial_guess: Optional[float] = None,
     tol: float = 1e-6,
-    max_iter: int = 50,
+    max_iter: int = 100,
 ) -> float:
     """
     Solve for implied volatility using Newton-Raphson
     with bisection fallback.
+
+    Newton starts from `initial_guess` when given, otherwise from the
+    Corrado-Miller approximation. Every iteration narrows a bracket
+    [SIGMA_MIN, SIGMA_MAX] around the root (price is increasing in
+    sigma); a Newton step that would leave the bracket, or a vanishing
+    vega, bisects instead, so the solve always converges for prices
+    inside the no-arbitrage bounds and rejects the rest up front.
     """
     if market_price <= 0:
         raise ImpliedVolError("Market price must be positive")
@@ -32,56 +102,114 @@ def implied_vol(
     if T <= 0:
         raise ImpliedVolError("Implied vol undefined at expiry")
 
-    # --- Newton-Raphson ---
-    sigma = max(initial_guess, 1e-4)
+    # Everything but sigma is fixed across iterations
+    S, K, r, q = market.spot, option.strike, market.rate, market.dividend_yield
+    is_call = option.option_type == "call"
 
-    for _ in range(max_iter):
-        market_with_sigma = MarketSnapshot(
-            spot=market.spot,
-            rate=market.rate,
-            dividend_yield=market.dividend_yield,
-            volatility=sigma,
-            timestamp=market.timestamp,
-        )
+    # No-arbitrage bounds: discounted intrinsic < price < discounted
+    # spot (call) or strike (put)
+    S_dq = S * math.exp(-q * T)
+    K_dr = K * math.exp(-r * T)
+    lower = max(S_dq - K_dr if is_call else K_dr - S_dq, 0.0)
+    upper = S_dq if is_call else K_dr
+    if not lower < market_price < upper:
+        raise ImpliedVolError("Market price outside no-arbitrage bounds")
 
-        model_price = price(option, market_with_sigma, today)
+    if initial_guess is None:
+        initial_guess = _initial_sigma_guess(market_price, S, K, T, r, q, is_call)
+
+    low, high = SIGMA_MIN, SIGMA_MAX
+    sigma = min(max(initial_guess, low), high)
+
+    for _ in range(max_iter):
+        model_price, vega = bs_price_vega_scalar(S, K, T, r, q, sigma, is_call)
         diff = model_price - market_price
 
         if abs(diff) < tol:
             return sigma
 
-        vega = greeks(option, market_with_sigma, today)["vega"]
+        if diff > 0:
+            high = sigma
+        else:
+            low = sigma
 
-        if vega < 1e-8:
-            break  # fallback
+        # Newton if the step stays inside the bracket, else bisect
+        step = sigma - diff / vega if vega > 1e-12 else math.inf
+        sigma = step if low < step < high else 0.5 * (low + high)
 
-        sigma -= diff / vega
+    raise ImpliedVolError("Implied volatility did not converge")
 
-        if sigma <= 0:
-            break  # fallback
 
-    # --- Bisection fallback ---
-    low, high = 1e-6, 5.0
+def implied_vol_batch(
+    market_prices,
+    S,
+    K,
+    T,
+    r,
+    q,
+    is_call,
+    *,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    Implied volatility for a whole array of quotes at once.
+
+    Inputs broadcast against each other like `bs_price_greeks` (`T` in
+    years, `is_call` a boolean mask), so e.g. a strike x expiry surface is
+    solved in one call and comes back in its own shape. Runs the same
+    bracketed Newton/bisection as `implied_vol`, one array pass per
+    iteration over the quotes not yet converged. Quotes that
+    `implied_vol` would reject (non-positive price, T <= 0, outside the
+    no-arbitrage bounds, no convergence) are NaN instead of raising.
+    """
+    arrays = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (market_prices, S, K, T, r, q)),
+        np.asarray(is_call, dtype=bool),
+    )
+    shape = arrays[0].shape
+    price, S, K, T, r, q, is_call = (a.ravel() for a in arrays)
+
+    S_dq = S * np.exp(-q * T)
+    K_dr = K * np.exp(-r * T)
+    lower = np.maximum(np.where(is_call, S_dq - K_dr, K_dr - S_dq), 0.0)
+    upper = np.where(is_call, S_dq, K_dr)
+    solvable = (price > 0) & (T > 0) & (lower < price) & (price < upper)
+
+    out = np.full(price.shape, np.nan)
+
+    # Work only on the quotes still being solved; rows drop out as they converge
+    idx = np.flatnonzero(solvable)
+    price, S, K, T, r, q, is_call = (a[idx] for a in (price, S, K, T, r, q, is_call))
+    sigma = _initial_sigma_guess_array(price, S_dq[idx], K_dr[idx], T, is_call)
+    sigma = np.clip(sigma, SIGMA_MIN, SIGMA_MAX)
+    low = np.full(idx.shape, SIGMA_MIN)
+    high = np.full(idx.shape, SIGMA_MAX)
 
-    for _ in range(100):
-        mid = 0.5 * (low + high)
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
 
-        market_mid = MarketSnapshot(
-            spot=market.spot,
-            rate=market.rate,
-            dividend_yield=market.dividend_yield,
-            volatility=mid,
-            timestamp=market.timestamp,
-        )
+        model = bs_price_greeks(S, K, T, r, q, sigma, is_call)
+        diff = model["price"] - price
+        vega = model["vega"]
 
-        mid_price = price(option, market_mid, today)
+        done = np.abs(diff) < tol
+        out[idx[done]] = sigma[done]
 
-        if abs(mid_price - market_price) < tol:
-            return mid
+        pending = ~done
+        idx, price, S, K, T, r, q, is_call, sigma, low, high, diff, vega = (
+            a[pending]
+            for a in (idx, price, S, K, T, r, q, is_call, sigma, low, high, diff, vega)
+        )
 
-        if mid_price > market_price:
-            high = mid
-        else:
-            low = mid
+        above = diff > 0
+        high = np.where(above, sigma, high)
+        low = np.where(above, low, sigma)
 
-    raise ImpliedVolError("Implied volatility did not converge")
+        # Newton if the step stays inside the bracket, else bisect
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.where(vega > 1e-12, sigma - diff / vega, np.inf)
+        sigma = np.where((low < step) & (step < high), step, 0.5 * (low + high))
+
+    return out.reshape(shape)
@@ -3,6 +3,8 @@ from typing import Dict, List
 import pandas as pd
 import numpy as np
 
+from app.core.config import WEIGHT_SUM_TOLERANCE
+
 
 # ---------- Data structures ----------
 
@@ -40,31 +42,20 @@ def accrue_risk_free_cash(
     if annual_rate == 0:
         return cash
 
-    cash = cash.copy()
-
     if compounding == "daily":
-        rate_per_step = annual_rate / 252
-        for i in range(1, len(cash)):
-            cash.iloc[i] = cash.iloc[i - 1] * (1 + rate_per_step)
+        step_factor = 1 + annual_rate / 252
 
     elif compounding == "quarterly":
-        rate_per_step = annual_rate / 4
-        for i in range(1, len(cash)):
-            cash.iloc[i] = cash.iloc[i - 1]
-            if cash.index[i].quarter != cash.index[i - 1].quarter:
-                cash.iloc[i] *= (1 + rate_per_step)
+        quarters = cash.index.quarter.to_numpy()
+        step_factor = np.where(quarters[1:] != quarters[:-1], 1 + annual_rate / 4, 1.0)
 
     elif compounding == "yearly":
-        rate_per_step = annual_rate
-        for i in range(1, len(cash)):
-            cash.iloc[i] = cash.iloc[i - 1]
-            if cash.index[i].year != cash.index[i - 1].year:
-                cash.iloc[i] *= (1 + rate_per_step)
+        years = cash.index.year.to_numpy()
+        step_factor = np.where(years[1:] != years[:-1], 1 + annual_rate, 1.0)
 
     elif compounding == "continuous":
         dt = 1 / 252
-        for i in range(1, len(cash)):
-            cash.iloc[i] = cash.iloc[i - 1] * np.exp(annual_rate * dt)
+        step_factor = np.exp(annual_rate * dt)
 
     else:
         raise ValueError(
@@ -72,6 +63,15 @@ def accrue_risk_free_cash(
             "Choose from: daily, quarterly, yearly, continuous."
         )
 
+    # Each step compounds the previous balance, so the whole path is the
+    # opening balance times a running product of per-step factors
+    if cash.empty:
+        return cash.copy()
+
+    factors = np.ones(len(cash))
+    factors[1:] = step_factor
+    cash = pd.Series(cash.iloc[0] * np.cumprod(factors), index=cash.index, name=cash.name)
+
     return cash
 
 
@@ -97,7 +97,7 @@ def simulate_portfolio(
     if not set(weights.keys()).issubset(prices.columns):
         raise ValueError("Weights contain tickers not present in price data")
 
-    if sum(weights.values()) > 1.0:
+    if sum(weights.values()) > 1.0 + WEIGHT_SUM_TOLERANCE:
         raise ValueError("Sum of weights must be <= 1.0")
 
     if rebalance != "none":
@@ -105,7 +105,8 @@ def simulate_portfolio(
 
     dates = prices.index
     first_date = dates[0]
-    first_prices = prices.loc[first_date]
+    # Plain dict: one row extraction instead of a pandas lookup per ticker
+    first_prices = prices.iloc[0].to_dict()
 
     # --- Initial allocation ---
     positions = {}
@@ -132,14 +133,23 @@ def simulate_portfolio(
                 )
             )
 
+    tickers = list(positions)
+    qty_vec = np.array([positions[t] for t in tickers], dtype=float)
+
     # --- Positions over time (buy & hold) ---
+    # Quantities never change, so every row is a read-only view of qty_vec
     positions_df = pd.DataFrame(
-        {ticker: qty for ticker, qty in positions.items()},
+        np.broadcast_to(qty_vec, (len(dates), len(tickers))),
         index=dates,
+        columns=tickers,
+        copy=False,
     )
 
     # --- Equity value ---
-    equity_value = (prices * positions_df).sum(axis=1)
+    # Missing prices contribute nothing, as with a skipna row sum
+    prices_mat = prices[tickers].to_numpy(dtype=float)
+    prices_mat = np.where(np.isnan(prices_mat), 0.0, prices_mat)
+    equity_value = pd.Series(prices_mat @ qty_vec, index=dates)
 
     # --- Cash series (before accrual) ---
     cash_series = pd.Series(remaining_cash, index=dates)
@@ -155,7 +165,11 @@ def simulate_portfolio(
     nav = equity_value + cash_series
 
     # --- Returns ---
-    daily_returns = nav.pct_change().fillna(0.0)
+    nav_arr = nav.to_numpy(dtype=float)
+    returns = np.zeros_like(nav_arr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns[1:] = nav_arr[1:] / nav_arr[:-1] - 1.0
+    daily_returns = pd.Series(np.where(np.isnan(returns), 0.0, returns), index=nav.index)
 
     return PortfolioResult(
         nav=nav,
@@ -2,20 +2,29 @@ import pandas as pd
 import numpy as np
 
 
-def serialize_series(series: pd.Series) -> dict:
+def format_dates(index: pd.Index) -> list[str]:
+    """ISO date strings for a DatetimeIndex."""
+    return index.strftime("%Y-%m-%d").tolist()
+
+
+def serialize_series(series: pd.Series, dates: list[str] | None = None) -> dict:
     """
     Convert a pandas Series to a JSON-serializable dictionary.
     
     Converts NaN/inf values to null for JSON compliance.
     Returns dict with 'dates' and 'values' keys.
+
+    `dates` may pass in already formatted strings for `series.index` when
+    several series share one index.
     """
-    dates = series.index.strftime("%Y-%m-%d").tolist()
+    if dates is None:
+        dates = format_dates(series.index)
     
     # Convert NaN and inf to None (null in JSON)
-    values = [
-        None if (pd.isna(v) or np.isinf(v)) else v
-        for v in series.values
-    ]
+    arr = np.asarray(series.values, dtype=float)
+    out = arr.astype(object)
+    out[~np.isfinite(arr)] = None
+    values = out.tolist()
     
     return {
         "dates": dates,
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import orjson
+
 from app.services.backtest_engine import run_backtest
 
 
@@ -16,8 +18,7 @@ def main():
     result = run_backtest(request_data)
 
     # Pretty-print for frontend readability
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(result, f, indent=2)
+    OUTPUT_FILE.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
 
     print(f"Example response written to {OUTPUT_FILE}")
 
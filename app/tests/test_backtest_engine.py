@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+import app.services.backtest_engine as engine
+
+
+BASE = dict(
+    start_date="2020-01-01",
+    end_date="2021-06-01",
+    initial_cash=10_000,
+    risk_free_rate=0.0,
+    benchmark_ticker="SPY",
+)
+
+
+@pytest.fixture
+def simulate_calls(monkeypatch):
+    """Weights of every simulate_portfolio call made by the engine."""
+    calls = []
+    simulate = engine.simulate_portfolio
+
+    def counting_simulate(*args, **kwargs):
+        calls.append(kwargs["weights"])
+        return simulate(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "simulate_portfolio", counting_simulate)
+    return calls
+
+
+def test_benchmark_only_portfolio_reuses_its_own_simulation(simulate_calls):
+    result = engine.run_backtest({**BASE, "positions": [{"ticker": "SPY", "weight": 1.0}]})
+
+    assert simulate_calls == [{"SPY": 1.0}]
+    assert result["series"]["benchmark_nav"] == result["series"]["nav"]
+    assert result["relative_metrics"]["excess_return"] == 0.0
+
+
+def test_mixed_portfolio_still_simulates_benchmark(simulate_calls):
+    engine.run_backtest(
+        {**BASE, "positions": [{"ticker": "SPY", "weight": 0.5}, {"ticker": "AAPL", "weight": 0.5}]}
+    )
+
+    assert simulate_calls[-1] == {"SPY": 1.0}
+    assert len(simulate_calls) == 2
+
+
+def test_result_is_plain_json():
+    result = engine.run_backtest({**BASE, "positions": [{"ticker": "AAPL", "weight": 1.0}]})
+
+    points = next(iter(result["rolling_metrics"]["series"].values()))
+    assert all(type(p["value"]) in (float, type(None)) for p in points)
+    json.dumps(result)
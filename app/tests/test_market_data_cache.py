@@ -0,0 +1,50 @@
+import pandas as pd
+
+from app.services.market_data import cache as cache_module
+from app.services.market_data.cache import (
+    _cached_load,
+    clear_price_cache,
+    load_prices_cached,
+)
+from app.services.market_data.loader import load_prices
+
+
+def test_cached_load_matches_loader():
+    clear_price_cache()
+    kwargs = dict(start_date="2020-01-01", end_date="2020-03-01", provider="mock")
+
+    cached = load_prices_cached(["MSFT", "AAPL"], **kwargs)
+    direct = load_prices(tickers=["MSFT", "AAPL"], **kwargs)
+
+    assert list(cached.columns) == ["MSFT", "AAPL"]
+    assert cached.equals(direct)
+
+
+def test_repeat_hits_served_from_cache_and_isolated():
+    clear_price_cache()
+    kwargs = dict(start_date="2020-01-01", end_date="2020-03-01", provider="mock")
+
+    first = load_prices_cached(["AAPL"], **kwargs)
+    first.iloc[0, 0] = -1.0
+    second = load_prices_cached(["AAPL"], **kwargs)
+
+    assert _cached_load.cache_info().hits == 1
+    assert second.iloc[0, 0] > 0
+
+
+def test_live_providers_bypass_the_cache(monkeypatch):
+    clear_price_cache()
+    calls = []
+
+    def fake_load(tickers, start_date, end_date, provider):
+        calls.append(provider)
+        return pd.DataFrame({t: [1.0] for t in tickers})
+
+    monkeypatch.setattr(cache_module, "load_prices", fake_load)
+    kwargs = dict(start_date="2020-01-01", end_date="2020-03-01", provider="stooq")
+
+    load_prices_cached(["AAPL"], **kwargs)
+    load_prices_cached(["AAPL"], **kwargs)
+
+    assert calls == ["stooq", "stooq"]
+    assert _cached_load.cache_info().currsize == 0
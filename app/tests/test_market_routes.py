@@ -0,0 +1,32 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+client = TestClient(app)
+
+
+def test_history_returns_etag_and_revalidates_with_304():
+    first = client.get("/api/v1/market/history/AAPL", params={"days": 20})
+    assert first.status_code == 200
+    assert len(first.json()) == 20
+    etag = first.headers["etag"]
+
+    again = client.get(
+        "/api/v1/market/history/AAPL",
+        params={"days": 20},
+        headers={"If-None-Match": etag},
+    )
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+def test_history_etag_depends_on_window():
+    a = client.get("/api/v1/market/history/AAPL", params={"days": 20})
+    b = client.get(
+        "/api/v1/market/history/AAPL",
+        params={"days": 30},
+        headers={"If-None-Match": a.headers["etag"]},
+    )
+    assert b.status_code == 200
+    assert len(b.json()) == 30
@@ -12,6 +12,8 @@ from app.services.metrics.metrics import (
     tracking_error,
     information_ratio,
     compute_metrics,
+    rolling_max_drawdown,
+    rolling_cagr,
 )
 
 
@@ -119,6 +121,40 @@ def test_max_drawdown_negative_for_drop():
     assert mdd > -1.0
 
 
+def test_rolling_max_drawdown_matches_per_window_definition():
+    rng = np.random.default_rng(0)
+    nav = make_nav_series(n_days=300)
+    nav *= np.exp(np.cumsum(rng.normal(0.0, 0.01, len(nav))))
+
+    expected = nav.rolling(window=20).apply(max_drawdown, raw=False)
+    result = rolling_max_drawdown(nav, window=20)
+
+    assert result.iloc[:19].isna().all()
+    np.testing.assert_allclose(result.iloc[19:], expected.iloc[19:])
+
+
+def test_rolling_max_drawdown_all_nan_when_window_exceeds_history():
+    nav = make_nav_series(n_days=10)
+    assert rolling_max_drawdown(nav, window=20).isna().all()
+
+
+def test_rolling_cagr_constant_growth():
+    nav = make_nav_series(daily_return=0.001, n_days=300)
+    result = rolling_cagr(nav, window=252)
+
+    assert result.iloc[:251].isna().all()
+    np.testing.assert_allclose(result.iloc[251:], 1.001 ** 251 - 1.0)
+
+
+def test_rolling_cagr_nan_for_non_positive_start():
+    nav = make_nav_series(n_days=30)
+    nav.iloc[0] = 0.0
+    result = rolling_cagr(nav, window=10)
+
+    assert np.isnan(result.iloc[9])
+    assert np.isfinite(result.iloc[10])
+
+
 # -------------------------------------------------
 # Relative metrics
 # -------------------------------------------------
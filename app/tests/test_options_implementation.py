@@ -10,6 +10,7 @@ Tests all endpoints and functionality to verify correct integration of:
 
 import pytest
 from datetime import date
+from pydantic import ValidationError
 
 from app.services.options.options_service import OptionsService
 from app.api.schemas import (
@@ -118,6 +119,16 @@ def test_parse_positions(service, sample_call):
     assert positions[0].quantity == 1.0
 
 
+def test_parse_positions_soa(service, sample_call, sample_put):
+    """Test netted struct-of-arrays parsing."""
+    book = service.parse_positions_soa([sample_call, sample_put, sample_call])
+    assert len(book) == 2
+    assert book.strike.tolist() == [180.0, 180.0]
+    assert book.quantity.tolist() == [2.0, 1.0]
+    assert book.is_call.tolist() == [True, False]
+    assert book.expiry_ordinal[0] == date(2026, 6, 19).toordinal()
+
+
 def test_parse_market(service, sample_market):
     """Test JSON market parsing."""
     market = service.parse_market(sample_market)
@@ -134,6 +145,21 @@ def test_parse_market_default_dividend(service):
     assert market.dividend_yield == 0.0
 
 
+def test_parsed_payloads_are_accepted_as_is(service, sample_call, sample_put, sample_market, today):
+    """Pre-parsed domain objects skip re-parsing and price identically."""
+    positions = service.parse_positions([sample_call, sample_put])
+    market = service.parse_market(sample_market)
+    book = service.parse_positions_soa(positions)
+
+    assert service.parse_positions(positions) == positions
+    assert service.parse_market(market) is market
+    assert service.parse_positions_soa(book) is book
+
+    raw = service.run_spot_scenario([sample_call, sample_put], sample_market, today, spots=[170.0, 190.0])
+    parsed = service.run_spot_scenario(positions, market, today, spots=[170.0, 190.0])
+    assert parsed == raw
+
+
 # ============================================================
 # TEST: Monte Carlo Scenario
 # ============================================================
@@ -332,6 +358,14 @@ def test_schema_option_position():
     assert pos.type == "call"
 
 
+def test_schema_option_position_rejects_non_iso_dates():
+    """Unpadded dates are rejected at validation, not deep in a service."""
+    data = {"symbol": "AAPL", "type": "call", "strike": 180.0, "expiry": "2026-06-19"}
+    for bad in ({"expiry": "2026-6-19"}, {"entry_date": "2024-1-5"}):
+        with pytest.raises(ValidationError):
+            OptionPositionInput(**{**data, **bad})
+
+
 def test_schema_market_snapshot():
     """Test MarketSnapshotInput schema."""
     data = {
@@ -0,0 +1,118 @@
+from fastapi.testclient import TestClient
+
+from app.api.routes.options import router
+from app.main import app
+from app.services.options.scenarios.surfaces import _cached_surface_grid, clear_surface_cache
+
+
+EXPECTED_OPTIONS_PATHS = {
+    "/api/v1/options/monte-carlo",
+    "/api/v1/options/crash",
+    "/api/v1/options/spot-vol-surface",
+    "/api/v1/options/spot-time-surface",
+    "/api/v1/options/spot-scenario",
+    "/api/v1/options/vol-scenario",
+    "/api/v1/options/time-scenario",
+    "/api/v1/options/payoff",
+    "/api/v1/options/strategy-timeline",
+}
+
+
+def test_options_router_registers_each_path_once():
+    paths = [r.path for r in router.routes]
+
+    assert len(paths) == len(set(paths))
+    assert set(paths) == EXPECTED_OPTIONS_PATHS
+
+
+def test_app_mounts_options_router_once():
+    paths = {p for p in app.openapi()["paths"] if p.startswith("/api/v1/options/")}
+
+    assert paths == EXPECTED_OPTIONS_PATHS
+
+
+def test_raw_json_bodies_keep_validation_errors_and_schema():
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/options/monte-carlo",
+        json={
+            "positions": [],
+            "market": {"spot": -1, "rate": 0.0, "volatility": 0.2},
+            "today": "2026-01-22",
+            "horizon_days": 30,
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "market", "spot"]
+
+    body = app.openapi()["paths"]["/api/v1/options/monte-carlo"]["post"]["requestBody"]
+    assert "horizon_days" in body["content"]["application/json"]["schema"]["properties"]
+
+
+def test_scenario_endpoints_accept_their_requests():
+    client = TestClient(app)
+    base = {
+        "positions": [
+            {"symbol": "AAPL", "type": "call", "strike": 180.0, "expiry": "2026-06-19", "quantity": 1.0},
+        ],
+        "market": {"spot": 185.0, "rate": 0.03, "dividend_yield": 0.005, "volatility": 0.25},
+        "today": "2026-01-22",
+    }
+    requests = {
+        "crash": {"crashes": [-0.1]},
+        "spot-vol-surface": {"spots": [150, 185], "vols": [0.2, 0.3]},
+        "spot-time-surface": {"spots": [150, 185], "horizons": [1, 10]},
+        "spot-scenario": {"spots": [150, 185]},
+        "vol-scenario": {"vols": [0.2, 0.3]},
+        "time-scenario": {"horizons": [1, 10]},
+    }
+
+    for path, extra in requests.items():
+        response = client.post(f"/api/v1/options/{path}", json={**base, **extra})
+        assert response.status_code == 200, path
+
+
+def test_monte_carlo_samples_render_from_ndarray():
+    client = TestClient(app)
+    response = client.post(
+        "/api/v1/options/monte-carlo",
+        json={
+            "positions": [
+                {"symbol": "AAPL", "type": "call", "strike": 180.0, "expiry": "2026-06-19", "quantity": 1.0},
+            ],
+            "market": {"spot": 185.0, "rate": 0.03, "dividend_yield": 0.005, "volatility": 0.25},
+            "today": "2026-01-22",
+            "horizon_days": 30,
+            "n_sims": 500,
+            "seed": 1,
+            "return_samples": True,
+        },
+    )
+
+    assert response.status_code == 200
+    samples = response.json()["samples"]
+    assert len(samples) == 500
+    assert all(isinstance(v, float) for v in samples)
+
+
+def test_repeated_surface_requests_reuse_the_cached_grid():
+    client = TestClient(app)
+    body = {
+        "positions": [
+            {"symbol": "AAPL", "type": "call", "strike": 180.0, "expiry": "2026-06-19", "quantity": 1.0},
+        ],
+        "market": {"spot": 185.0, "rate": 0.03, "dividend_yield": 0.005, "volatility": 0.25},
+        "today": "2026-01-22",
+        "spots": [150, 185, 220],
+        "vols": [0.2, 0.3],
+    }
+    clear_surface_cache()
+
+    first = client.post("/api/v1/options/spot-vol-surface", json=body)
+    second = client.post("/api/v1/options/spot-vol-surface", json=body)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    info = _cached_surface_grid.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
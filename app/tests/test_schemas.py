@@ -0,0 +1,47 @@
+import pytest
+from pydantic import ValidationError
+
+from app.api.schemas import BacktestRequest
+
+
+BASE = dict(
+    start_date="2020-01-01",
+    end_date="2020-06-01",
+    initial_cash=10_000,
+    risk_free_rate=0.0,
+)
+
+
+def test_weights_summing_to_one_up_to_roundoff_are_accepted():
+    req = BacktestRequest(
+        **BASE,
+        positions=[
+            {"ticker": "AAPL", "weight": 0.7},
+            {"ticker": "MSFT", "weight": 0.3000000001},
+        ],
+    )
+    assert len(req.positions) == 2
+
+
+def test_weights_over_one_are_rejected():
+    with pytest.raises(ValidationError, match="Sum of weights must be <= 1.0"):
+        BacktestRequest(
+            **BASE,
+            positions=[
+                {"ticker": "AAPL", "weight": 0.7},
+                {"ticker": "MSFT", "weight": 0.4},
+            ],
+        )
+
+
+def test_rejection_reports_the_total_weight():
+    with pytest.raises(ValidationError, match="got 1.5"):
+        BacktestRequest(
+            **BASE,
+            positions=[
+                {"ticker": "AAPL", "weight": 0.5},
+                {"ticker": "MSFT", "weight": 0.25},
+                {"ticker": "GOOG", "weight": 0.5},
+                {"ticker": "AMZN", "weight": 0.25},
+            ],
+        )
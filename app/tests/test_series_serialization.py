@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from app.services.serialization.series import serialize_series
+
+
+def test_serialize_series_nulls_non_finite_values():
+    series = pd.Series(
+        [1.5, np.nan, np.inf, -np.inf, 2.0],
+        index=pd.date_range("2024-01-01", periods=5, freq="D"),
+    )
+
+    result = serialize_series(series)
+
+    assert result["dates"] == [
+        "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05",
+    ]
+    assert result["values"] == [1.5, None, None, None, 2.0]
+    assert all(type(v) is float for v in result["values"] if v is not None)
@@ -1,5 +1,8 @@
+import numpy as np
+import pandas as pd
+
 from app.services.market_data.loader import load_prices
-from app.services.portfolio.simulator import simulate_portfolio
+from app.services.portfolio.simulator import accrue_risk_free_cash, simulate_portfolio
 
 
 def test_simulator_fractional_vs_integer_with_risk_free():
@@ -84,5 +87,28 @@ def test_simulator_fractional_vs_integer_with_risk_free():
     print("\nTest completed successfully.")
 
 
+def test_accrue_risk_free_cash_compounding_paths():
+    dates = pd.to_datetime(["2020-12-30", "2020-12-31", "2021-03-31", "2021-04-01", "2022-01-03"])
+    cash = pd.Series(1_000.0, index=dates)
+    rate = 0.04
+
+    daily = accrue_risk_free_cash(cash, rate, "daily")
+    assert np.allclose(daily.values, 1_000.0 * (1 + rate / 252) ** np.arange(5))
+
+    continuous = accrue_risk_free_cash(cash, rate, "continuous")
+    assert np.allclose(continuous.values, 1_000.0 * np.exp(rate / 252 * np.arange(5)))
+
+    # Accrues only when the quarter (or year) changes between consecutive dates
+    quarterly = accrue_risk_free_cash(cash, rate, "quarterly")
+    step = 1 + rate / 4
+    assert np.allclose(quarterly.values, 1_000.0 * np.array([1, 1, step, step**2, step**3]))
+
+    yearly = accrue_risk_free_cash(cash, rate, "yearly")
+    step = 1 + rate
+    assert np.allclose(yearly.values, 1_000.0 * np.array([1, 1, step, step, step**2]))
+
+    assert cash.iloc[-1] == 1_000.0  # input is left untouched
+
+
 if __name__ == "__main__":
     test_simulator_fractional_vs_integer_with_risk_free()